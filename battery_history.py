@@ -0,0 +1,84 @@
+import bisect
+import threading
+from array import array
+from typing import List, NamedTuple, Optional
+
+# One week of samples taken every 5 seconds
+DEFAULT_CAPACITY = 7 * 24 * 3600 // 5
+
+
+class HistoryView(NamedTuple):
+    """Zero-copy memoryviews over one contiguous, chronological run of samples."""
+    timestamps: memoryview
+    percents: memoryview
+    plugged: memoryview
+    secsleft: memoryview
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+class BatteryHistory:
+    """Fixed-capacity ring buffer of battery samples stored in parallel typed arrays.
+
+    Each sample costs 17 bytes (float64 timestamp, float32 percent, int8
+    plugged, int32 secsleft), so the default week of 5-second samples is
+    about 2 MB. Once full, the oldest samples are overwritten.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._percents = array("f", bytes(4 * capacity))
+        self._plugged = array("b", bytes(capacity))
+        self._secsleft = array("i", bytes(4 * capacity))
+        self._columns = (self._timestamps, self._percents, self._plugged, self._secsleft)
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    def append(self, timestamp: float, percent: float, plugged: bool, secsleft: int):
+        with self._lock:
+            i = self._next
+            self._timestamps[i] = timestamp
+            self._percents[i] = percent
+            self._plugged[i] = 1 if plugged else 0
+            self._secsleft[i] = max(-2 ** 31, min(secsleft, 2 ** 31 - 1))
+            self._next = (i + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def latest(self) -> Optional[tuple]:
+        with self._lock:
+            if not self._size:
+                return None
+            i = self._next - 1
+            return (self._timestamps[i], self._percents[i], bool(self._plugged[i]), self._secsleft[i])
+
+    def segments(self) -> List[HistoryView]:
+        """Chronological views of the buffer: one run, or two once it has wrapped.
+
+        The views share memory with the buffer, so slice them instead of
+        holding them across appends if the data must not change underneath.
+        """
+        with self._lock:
+            if self._size < self.capacity:
+                ranges = [(0, self._size)]
+            else:
+                ranges = [(self._next, self.capacity), (0, self._next)]
+        views = []
+        for start, stop in ranges:
+            if stop > start:
+                views.append(HistoryView(*(memoryview(column)[start:stop] for column in self._columns)))
+        return views
+
+    def since(self, timestamp: float) -> List[HistoryView]:
+        """Views of the samples taken at or after timestamp."""
+        views = []
+        for view in self.segments():
+            start = bisect.bisect_left(view.timestamps, timestamp)
+            if start < len(view):
+                views.append(HistoryView(*(column[start:] for column in view)))
+        return views
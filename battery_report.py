@@ -0,0 +1,89 @@
+import logging
+
+from lazy_import import LazyModule
+
+# lxml is only needed once a report exists; keep it off the startup path
+etree = LazyModule("lxml.etree")
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 16 * 1024
+
+FIELDS = {
+    "DESIGN CAPACITY": "design_capacity",
+    "FULL CHARGE CAPACITY": "full_charge_capacity",
+    "CYCLE COUNT": "cycle_count",
+}
+
+
+class _InstalledBatteriesTarget:
+    """lxml parser target that collects two-cell key/value rows.
+
+    It marks itself done once every field is found, or at the end of the
+    table that held the battery's design capacity, so the caller can stop
+    feeding the (often multi-megabyte) usage history that follows.
+    """
+
+    def __init__(self):
+        self.details = {key: None for key in FIELDS.values()}
+        self.done = False
+        self._cells = None
+        self._cell = None
+        self._found_in_table = False
+
+    def start(self, tag, attrib):
+        if tag == "tr":
+            self._cells = []
+        elif tag in ("td", "th") and self._cells is not None:
+            self._cell = []
+
+    def data(self, text):
+        if self._cell is not None:
+            self._cell.append(text.strip())
+
+    def end(self, tag):
+        if tag in ("td", "th") and self._cell is not None:
+            self._cells.append("".join(self._cell))
+            self._cell = None
+        elif tag == "tr" and self._cells is not None:
+            self._row(self._cells)
+            self._cells = None
+        elif tag == "table" and self._found_in_table:
+            self.done = True
+
+    def _row(self, cells):
+        if len(cells) != 2:
+            return
+        key, value = cells
+        key = key.upper()
+        for label, field in FIELDS.items():
+            if label in key and self.details[field] is None:
+                self.details[field] = value
+                self._found_in_table = True
+                break
+        if all(value is not None for value in self.details.values()):
+            self.done = True
+
+    def close(self):
+        return self.details
+
+
+def parse_battery_report(report_path="battery_report.html"):
+    """Extract design capacity, full-charge capacity and cycle count from a powercfg report.
+
+    The file is fed to lxml in chunks and parsing stops as soon as the
+    installed-batteries table has been read.
+    """
+    target = _InstalledBatteriesTarget()
+    parser = etree.HTMLParser(target=target, encoding="utf-8")
+    with open(report_path, "rb") as f:
+        while not target.done:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+    try:
+        parser.close()
+    except etree.XMLSyntaxError as e:
+        logger.warning(f"Battery report ended unexpectedly: {e}")
+    return target.details
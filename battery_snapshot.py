@@ -0,0 +1,68 @@
+import logging
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 2.0
+
+
+class BatterySnapshot(NamedTuple):
+    """Immutable battery reading, field-compatible with psutil's sbattery."""
+    percent: float
+    secsleft: int
+    power_plugged: bool
+    timestamp: float
+
+
+class BatterySampler:
+    """Owns the hardware battery read and publishes the latest snapshot.
+
+    Consumers call get() and receive the published snapshot as long as it is
+    younger than max_age seconds; only a stale snapshot triggers a new read.
+    """
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE,
+                 reader: Optional[Callable[[], object]] = None):
+        self.max_age = max_age
+        self._reader = reader or psutil.sensors_battery
+        self._lock = threading.Lock()
+        self._snapshot: Optional[BatterySnapshot] = None
+        self._sampled_at: Optional[float] = None
+        self.reads = 0
+
+    def sample(self) -> Optional[BatterySnapshot]:
+        """Read the hardware now and publish the result."""
+        with self._lock:
+            return self._sample_locked()
+
+    def get(self, max_age: Optional[float] = None) -> Optional[BatterySnapshot]:
+        """Return the published snapshot, refreshing it if it is too old."""
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            if self._sampled_at is not None and time.monotonic() - self._sampled_at <= max_age:
+                return self._snapshot
+            return self._sample_locked()
+
+    @property
+    def latest(self) -> Optional[BatterySnapshot]:
+        """The last published snapshot, regardless of its age."""
+        return self._snapshot
+
+    def _sample_locked(self) -> Optional[BatterySnapshot]:
+        try:
+            battery = self._reader()
+        except Exception as e:
+            logger.error(f"Battery read failed: {e}")
+            battery = None
+        self.reads += 1
+        self._sampled_at = time.monotonic()
+        if battery is None:
+            self._snapshot = None
+        else:
+            self._snapshot = BatterySnapshot(battery.percent, battery.secsleft,
+                                             battery.power_plugged, time.time())
+        return self._snapshot
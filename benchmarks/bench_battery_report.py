@@ -0,0 +1,87 @@
+"""Compare the streaming battery-report parser with a full BeautifulSoup parse.
+
+Generates synthetic powercfg reports of increasing size (the usage history
+tables are what grow over the years) and times both approaches:
+    python benchmarks/bench_battery_report.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from battery_report import parse_battery_report
+
+HEADER = """<!DOCTYPE html><html><head><title>Battery report</title></head><body>
+<h1>Battery report</h1>
+<table><tr><td>COMPUTER NAME</td><td>BENCH-PC</td></tr><tr><td>REPORT TIME</td><td>2026-01-01</td></tr></table>
+<h2>Installed batteries</h2>
+<table>
+<tr><td><span class="label">NAME</span></td><td>Primary</td></tr>
+<tr><td><span class="label">MANUFACTURER</span></td><td>ACME</td></tr>
+<tr><td><span class="label">CHEMISTRY</span></td><td>LiP</td></tr>
+<tr><td><span class="label">DESIGN CAPACITY</span></td><td>57,000 mWh</td></tr>
+<tr><td><span class="label">FULL CHARGE CAPACITY</span></td><td>51,300 mWh</td></tr>
+<tr><td><span class="label">CYCLE COUNT</span></td><td>312</td></tr>
+</table>
+<h2>Battery capacity history</h2>
+<table><thead><tr><td>PERIOD</td><td>FULL CHARGE CAPACITY</td><td>DESIGN CAPACITY</td></tr></thead>
+"""
+ROW = "<tr><td>2025-{0:05d}</td><td>{1:,} mWh</td><td>57,000 mWh</td></tr>\n"
+FOOTER = "</table></body></html>\n"
+
+
+def write_report(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        for i in range(rows):
+            f.write(ROW.format(i, 57000 - i % 5000))
+        f.write(FOOTER)
+
+
+def extract_with_beautifulsoup(report_path):
+    """The previous implementation from smc.py, minus its debug printing."""
+    details = {"design_capacity": None, "full_charge_capacity": None, "cycle_count": None}
+    with open(report_path, "r", encoding="utf-8") as f:
+        soup = BeautifulSoup(f, "lxml")
+    installed_section = soup.find_all("table")[1]
+    for row in installed_section.find_all("tr"):
+        cells = [c.get_text(strip=True) for c in row.find_all(["td", "th"])]
+        if len(cells) == 2:
+            key, value = cells
+            if "DESIGN CAPACITY" in key:
+                details["design_capacity"] = value
+            elif "FULL CHARGE CAPACITY" in key:
+                details["full_charge_capacity"] = value
+            elif "CYCLE COUNT" in key:
+                details["cycle_count"] = value
+    return details
+
+
+def best_of(func, path, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(path)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "battery_report.html")
+        print(f"{'size':>10} {'bs4 (ms)':>10} {'stream (ms)':>12} {'speedup':>8}")
+        for rows in (100, 1000, 10000, 100000):
+            write_report(path, rows)
+            full_time, expected = best_of(extract_with_beautifulsoup, path)
+            stream_time, result = best_of(parse_battery_report, path)
+            assert result == expected, (result, expected)
+            size_kb = os.path.getsize(path) / 1024
+            print(f"{size_kb:8.0f}KB {full_time * 1e3:10.2f} {stream_time * 1e3:12.2f} {full_time / stream_time:7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure the memory released by the lean tray (release_ui / rebuild_ui).
+
+Starts the app with SAVEMYCELL_LEAN_TRAY_PROBE set: it builds every page,
+withdraws the window, calls release_ui() and rebuild_ui() and prints the
+RSS before and after the release and after the rebuild, then exits. The
+window is never shown, but Tk still needs a desktop session (or a
+virtual display) to start.
+
+Run from the repository root:
+    python benchmarks/bench_lean_tray.py [--runs 5] [--min-saving-mb 5]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RSS_LINE = re.compile(r"lean_tray_rss_before=(\d+) lean_tray_rss_after=(\d+) lean_tray_rss_rebuilt=(\d+)")
+
+
+def run_once(args):
+    command = [sys.executable, os.path.join(ROOT, args.target)]
+    env = dict(os.environ, SAVEMYCELL_LEAN_TRAY_PROBE="1")
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, timeout=args.timeout)
+    match = RSS_LINE.search(result.stdout)
+    if not match:
+        tail = "\n".join(result.stderr.splitlines()[-5:])
+        raise RuntimeError(f"probe failed with exit code {result.returncode}:\n{tail}")
+    return tuple(int(value) / 1e6 for value in match.groups())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="smc.py", help="script to start (default: smc.py)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--min-saving-mb", type=float, help="fail if the median release frees less than this")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    samples = [run_once(args) for _ in range(args.runs)]
+    before, after, rebuilt = (statistics.median(column) for column in zip(*samples))
+    saving = before - after
+
+    print(f"{'run':>4} {'before MB':>10} {'released MB':>12} {'rebuilt MB':>11}")
+    for run, (b, a, r) in enumerate(samples, 1):
+        print(f"{run:>4} {b:10.1f} {a:12.1f} {r:11.1f}")
+    print(f"\nmedian of {args.runs}: {before:.1f} MB -> {after:.1f} MB in the tray "
+          f"({saving:.1f} MB released), {rebuilt:.1f} MB after restoring")
+    if args.min_saving_mb is not None and saving < args.min_saving_mb:
+        print(f"below target: {saving:.1f} MB < {args.min_saving_mb:.1f} MB")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measure startup import time and time to first paint.
+
+Runs the app under `python -X importtime` with SAVEMYCELL_STARTUP_PROBE set,
+so it prints the time from process start to its first drawn frame and
+exits. The slowest top-level imports are listed to spot regressions.
+
+Run from the repository root:
+    python benchmarks/bench_startup.py [--runs 5] [--budget-ms 1500]
+
+Where the app cannot start (no display, no winreg), --module measures
+only the import cost of a module, e.g. --module battery_report.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+FIRST_PAINT = re.compile(r"first_paint_ms=([\d.]+)")
+
+
+def run_once(args):
+    if args.module:
+        command = [sys.executable, "-X", "importtime", "-c", f"import {args.module}"]
+    else:
+        command = [sys.executable, "-X", "importtime", os.path.join(ROOT, args.target)]
+    env = dict(os.environ, SAVEMYCELL_STARTUP_PROBE="1")
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, timeout=args.timeout)
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        # Top-level imports only; nested ones are included in their parent's cumulative time
+        if match and len(match.group(3)) == 1:
+            imports[match.group(4)] = int(match.group(2)) / 1000
+    paint = FIRST_PAINT.search(result.stdout)
+    if result.returncode != 0 and not paint:
+        tail = "\n".join(result.stderr.splitlines()[-5:])
+        raise RuntimeError(f"startup failed with exit code {result.returncode}:\n{tail}")
+    return imports, float(paint.group(1)) if paint else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="smc.py", help="script to start (default: smc.py)")
+    parser.add_argument("--module", help="only import this module instead of starting the app")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="number of slowest imports to list")
+    parser.add_argument("--budget-ms", type=float, help="fail if the median first paint (or import time) exceeds this")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    samples = [run_once(args) for _ in range(args.runs)]
+    import_totals = [sum(imports.values()) for imports, _ in samples]
+    paints = [paint for _, paint in samples if paint is not None]
+
+    slowest = {}
+    for imports, _ in samples:
+        for name, ms in imports.items():
+            slowest.setdefault(name, []).append(ms)
+    ranked = sorted(((statistics.median(ms), name) for name, ms in slowest.items()), reverse=True)
+
+    print(f"{'module':40} {'cumulative ms':>14}")
+    for ms, name in ranked[:args.top]:
+        print(f"{name:40} {ms:14.1f}")
+    print(f"\ntop-level imports: {statistics.median(import_totals):.1f} ms (median of {args.runs})")
+    measured = statistics.median(import_totals)
+    if paints:
+        measured = statistics.median(paints)
+        print(f"time to first paint: {measured:.1f} ms (median of {len(paints)})")
+    if args.budget_ms is not None and measured > args.budget_ms:
+        print(f"over budget: {measured:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare SysfsBatteryReader with psutil.sensors_battery() on a fake sysfs tree.
+
+Run from the repository root on Linux:
+    python benchmarks/bench_sysfs_battery.py [iterations]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil
+from psutil import _pslinux
+
+from sysfs_battery import SysfsBatteryReader
+
+FAKE_SUPPLIES = {
+    "AC": {"type": "Mains", "online": "0"},
+    "BAT0": {
+        "type": "Battery",
+        "capacity": "87",
+        "status": "Discharging",
+        "energy_now": "43500000",
+        "energy_full": "50000000",
+        "power_now": "9000000",
+    },
+}
+
+
+def build_fake_tree(root):
+    for supply, attributes in FAKE_SUPPLIES.items():
+        os.makedirs(os.path.join(root, supply))
+        for name, value in attributes.items():
+            with open(os.path.join(root, supply, name), "w") as f:
+                f.write(value + "\n")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as root:
+        build_fake_tree(root)
+        _pslinux.POWER_SUPPLY_PATH = root
+        reader = SysfsBatteryReader(root)
+        print("psutil:", psutil.sensors_battery())
+        print("sysfs: ", reader())
+        psutil_time = timeit.timeit(psutil.sensors_battery, number=iterations)
+        sysfs_time = timeit.timeit(reader, number=iterations)
+        reader.close()
+    print(f"psutil.sensors_battery(): {psutil_time / iterations * 1e6:8.2f} us/call")
+    print(f"SysfsBatteryReader():     {sysfs_time / iterations * 1e6:8.2f} us/call")
+    print(f"speedup: {psutil_time / sysfs_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import json
+import logging
+import math
+import os
+import threading
+from array import array
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FILE = "charge_profile.json"
+DEFAULT_PROFILE_PATH = os.path.join(os.path.expanduser("~"), "AppData", "Local", "SaveMyCell", PROFILE_FILE)
+LEARNING_RATE = 0.3
+# A single percent taking longer than this means the machine slept or the charger stalled
+MAX_SECONDS_PER_PERCENT = 3600
+
+
+def prior_seconds_per_percent(percent: int) -> float:
+    """Seconds to charge one percent under the original 40-60 %/h curve."""
+    charging_rate = 40.0 + (60.0 - 40.0) * (1 - percent / 100)
+    return 3600 / charging_rate
+
+
+class ChargeTimeEstimator:
+    """Per-percent charge-rate table learned from this machine's charging sessions.
+
+    Each bin holds the seconds it takes to charge from that percent to the
+    next, starting from the original hard-coded curve and moved towards
+    observed step durations, which captures the slow CC/CV tail above 80%.
+    A suffix-sum table is kept alongside so seconds_to_full() is O(1).
+    The timestamp of the newest sample fed in is saved with the profile, so
+    replaying the history log after a restart skips samples already learned.
+    """
+
+    def __init__(self, path: str = DEFAULT_PROFILE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self.seconds_per_percent = array("d", (prior_seconds_per_percent(p) for p in range(100)))
+        self.observations = array("I", bytes(4 * 100))
+        self._to_full = array("d", bytes(8 * 101))
+        self._rebuild_suffix(99)
+        self._step_percent = None
+        self._step_time = None
+        self._anchored = False
+        self.learned_until = 0.0
+        # Bumped whenever the table changes, so callers can invalidate derived text
+        self.generation = 0
+        self.dirty = False
+
+    def _rebuild_suffix(self, upto: int):
+        for p in range(upto, -1, -1):
+            self._to_full[p] = self._to_full[p + 1] + self.seconds_per_percent[p]
+
+    def observe(self, timestamp: float, percent: float, plugged: bool):
+        """Feed one sample; charging sessions are segmented on plug state.
+
+        A percent boundary is taken to be crossed halfway between the last
+        sample below it and the first one at or above it. Steps that cross
+        more than one percent between two samples, as happens when the
+        monitor sleeps for minutes, teach nothing: neither how the time
+        splits across those percents nor when the new one was entered is
+        known.
+        """
+        with self._lock:
+            if timestamp <= self.learned_until:
+                return
+            previous, self.learned_until = self.learned_until, timestamp
+            if not plugged:
+                self._step_percent = None
+                return
+            whole = min(int(percent), 100)
+            if self._step_percent is None or whole < self._step_percent:
+                # New session: the first partial percent has an unknown start time
+                self._step_percent, self._step_time, self._anchored = whole, timestamp, False
+                return
+            if whole == self._step_percent:
+                return
+            crossed_at = (previous + timestamp) / 2
+            single_step = whole - self._step_percent == 1
+            if self._anchored and single_step:
+                self._learn(self._step_percent, whole, crossed_at - self._step_time)
+            self._step_percent, self._step_time, self._anchored = whole, crossed_at, single_step
+
+    def end_session(self):
+        with self._lock:
+            self._step_percent = None
+
+    def _learn(self, start: int, stop: int, elapsed: float):
+        per_percent = elapsed / (stop - start)
+        if per_percent <= 0 or per_percent > MAX_SECONDS_PER_PERCENT:
+            return
+        for p in range(start, min(stop, 100)):
+            self.seconds_per_percent[p] += LEARNING_RATE * (per_percent - self.seconds_per_percent[p])
+            self.observations[p] += 1
+        self._rebuild_suffix(min(stop, 100) - 1)
+        self.generation += 1
+        self.dirty = True
+
+    def seconds_to_full(self, percent: float) -> float:
+        if percent >= 100:
+            return 0.0
+        whole = max(int(percent), 0)
+        fraction = percent - whole
+        return self._to_full[whole] - fraction * self.seconds_per_percent[whole]
+
+    def save(self, path: Optional[str] = None) -> bool:
+        path = path or self.path
+        try:
+            with self._lock:
+                profile = {
+                    "seconds_per_percent": list(self.seconds_per_percent),
+                    "observations": list(self.observations),
+                    "learned_until": self.learned_until,
+                }
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(profile, f)
+            os.replace(tmp_path, path)
+            self.dirty = False
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save charge profile: {e}")
+            return False
+
+    def load(self, path: Optional[str] = None) -> bool:
+        path = path or self.path
+        try:
+            with open(path, "r") as f:
+                profile = json.load(f)
+            seconds = [float(s) for s in profile["seconds_per_percent"]]
+            observations = [int(n) for n in profile["observations"]]
+            learned_until = float(profile.get("learned_until", 0.0))
+            if len(seconds) != 100 or len(observations) != 100 or not all(map(math.isfinite, seconds)):
+                raise ValueError("Malformed charge profile")
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error(f"Failed to load charge profile from {path}: {e}")
+            return False
+        with self._lock:
+            self.seconds_per_percent = array("d", seconds)
+            self.observations = array("I", observations)
+            self.learned_until = learned_until
+            self._rebuild_suffix(99)
+            self.generation += 1
+        return True
+
+
+_shared_estimator = None
+
+
+def shared_estimator() -> ChargeTimeEstimator:
+    """Process-wide estimator, loaded from the saved profile on first use."""
+    global _shared_estimator
+    if _shared_estimator is None:
+        _shared_estimator = ChargeTimeEstimator()
+        _shared_estimator.load()
+    return _shared_estimator
@@ -0,0 +1,173 @@
+import logging
+import os
+import secrets
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from typing import Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DIR = os.path.join(os.path.expanduser("~"), "AppData", "Local", "SaveMyCell")
+AUTHKEY_FILE = "daemon.key"
+DEFAULT_ENDPOINT = "savemycell"
+CONNECT_RETRY = 0.1
+
+Handler = Callable[[dict], dict]
+
+
+def daemon_address(state_dir: str = DEFAULT_STATE_DIR, endpoint: str = DEFAULT_ENDPOINT) -> str:
+    """Named pipe on Windows, a Unix socket in the runtime or state directory elsewhere."""
+    if sys.platform == "win32":
+        user = os.environ.get("USERNAME", "user")
+        return rf"\\.\pipe\{endpoint}-{user}"
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or state_dir
+    return os.path.join(runtime_dir, f"{endpoint}.sock")
+
+
+def load_authkey(state_dir: str = DEFAULT_STATE_DIR, create: bool = False) -> Optional[bytes]:
+    """Per-user secret shared by servers and their clients; only servers create it."""
+    path = os.path.join(state_dir, AUTHKEY_FILE)
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        if not create:
+            return None
+    os.makedirs(state_dir, exist_ok=True)
+    key = secrets.token_bytes(32)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+class DaemonServer:
+    """Request/response server for the monitoring daemon over multiprocessing.connection.
+
+    Each message is a dict with a "cmd" key; handlers return a dict that is
+    sent back. A client that sends {"cmd": "subscribe"} keeps its connection
+    and receives every dict passed to publish() until it disconnects.
+    """
+
+    def __init__(self, handlers: Dict[str, Handler], state_dir: str = DEFAULT_STATE_DIR,
+                 endpoint: str = DEFAULT_ENDPOINT):
+        self.handlers = handlers
+        self.address = daemon_address(state_dir, endpoint)
+        self._authkey = load_authkey(state_dir, create=True)
+        self._listener = None
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self):
+        if sys.platform != "win32" and os.path.exists(self.address):
+            # A socket left behind by a crashed daemon; a live one would have answered
+            if DaemonClient.connect(address=self.address, authkey=self._authkey):
+                raise RuntimeError(f"Another daemon is already listening on {self.address}")
+            os.unlink(self.address)
+        self._listener = Listener(self.address, authkey=self._authkey)
+        threading.Thread(target=self._accept_loop, name="daemon-ipc", daemon=True).start()
+        logger.info(f"Daemon listening on {self.address}")
+
+    def close(self):
+        self._closed = True
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for conn in subscribers:
+            conn.close()
+        if self._listener:
+            self._listener.close()
+            if sys.platform != "win32" and os.path.exists(self.address):
+                os.unlink(self.address)
+
+    def publish(self, message: dict):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for conn in subscribers:
+            try:
+                conn.send(message)
+            except (OSError, EOFError):
+                with self._lock:
+                    if conn in self._subscribers:
+                        self._subscribers.remove(conn)
+                conn.close()
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except Exception as e:
+                if not self._closed:
+                    logger.warning(f"Rejected daemon client: {e}")
+                continue
+            threading.Thread(target=self._serve, args=(conn,), name="daemon-client", daemon=True).start()
+
+    def _serve(self, conn):
+        try:
+            while True:
+                request = conn.recv()
+                cmd = request.get("cmd") if isinstance(request, dict) else None
+                if cmd == "subscribe":
+                    with self._lock:
+                        self._subscribers.append(conn)
+                    conn.send({"ok": True})
+                    return
+                handler = self.handlers.get(cmd)
+                if handler is None:
+                    conn.send({"ok": False, "error": f"unknown command {cmd!r}"})
+                    continue
+                try:
+                    response = handler(request)
+                except Exception as e:
+                    logger.error(f"Daemon command {cmd!r} failed: {e}")
+                    response = {"ok": False, "error": str(e)}
+                conn.send(response)
+        except (EOFError, OSError):
+            conn.close()
+
+
+class DaemonClient:
+    """Connection to a running daemon; connect() returns None when none is running."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    @classmethod
+    def connect(cls, state_dir: str = DEFAULT_STATE_DIR, address: Optional[str] = None,
+                authkey: Optional[bytes] = None, endpoint: str = DEFAULT_ENDPOINT,
+                timeout: float = 0) -> Optional["DaemonClient"]:
+        """Connect, retrying for up to timeout seconds while a daemon is still starting."""
+        address = address or daemon_address(state_dir, endpoint)
+        deadline = time.monotonic() + timeout
+        while True:
+            key = authkey or load_authkey(state_dir)
+            if key is not None and (sys.platform == "win32" or os.path.exists(address)):
+                try:
+                    return cls(Client(address, authkey=key))
+                except Exception as e:
+                    if time.monotonic() >= deadline:
+                        logger.info(f"No monitoring daemon at {address}: {e}")
+                        return None
+            elif time.monotonic() >= deadline:
+                return None
+            time.sleep(CONNECT_RETRY)
+
+    def request(self, cmd: str, **params) -> dict:
+        with self._lock:
+            self._conn.send(dict(params, cmd=cmd))
+            return self._conn.recv()
+
+    def subscribe(self) -> Iterator[dict]:
+        """Turns this connection into an event stream; ends when the daemon goes away."""
+        self.request("subscribe")
+        while True:
+            try:
+                yield self._conn.recv()
+            except (EOFError, OSError):
+                return
+
+    def close(self):
+        self._conn.close()
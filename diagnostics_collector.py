@@ -0,0 +1,58 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SectionFunc = Callable[[], List[str]]
+DeliverFunc = Callable[[str, Optional[List[str]]], None]
+
+
+class DiagnosticsCollector:
+    """Collects diagnostic sections concurrently and remembers the last result of each.
+
+    refresh() submits every section that is not already being collected to a
+    small worker pool and calls deliver(title, items) from the worker thread
+    as each finishes (items is None on failure). Callers on the Tk thread
+    should hop back with root.after() before touching widgets.
+    """
+
+    def __init__(self, sections: Sequence[Tuple[str, SectionFunc]], max_workers: int = 3):
+        self.sections = list(sections)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="diagnostics")
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._pending = set()
+
+    @property
+    def titles(self) -> List[str]:
+        return [title for title, _ in self.sections]
+
+    def cached(self, title: str) -> Optional[List[str]]:
+        with self._lock:
+            return self._cache.get(title)
+
+    def is_refreshing(self, title: str) -> bool:
+        with self._lock:
+            return title in self._pending
+
+    def refresh(self, deliver: DeliverFunc):
+        for title, collect in self.sections:
+            with self._lock:
+                if title in self._pending:
+                    continue
+                self._pending.add(title)
+            self._executor.submit(self._collect, title, collect, deliver)
+
+    def _collect(self, title: str, collect: SectionFunc, deliver: DeliverFunc):
+        try:
+            items = list(collect())
+        except Exception as e:
+            logger.error(f"Failed to collect diagnostics section '{title}': {e}")
+            items = None
+        with self._lock:
+            self._pending.discard(title)
+            if items is not None:
+                self._cache[title] = items
+        deliver(title, items)
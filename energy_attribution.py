@@ -0,0 +1,104 @@
+import heapq
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 60
+DEFAULT_TOP_N = 5
+
+
+class ProcessEnergy(NamedTuple):
+    pid: int
+    name: str
+    cpu_seconds: float
+    share: float
+    percent_per_hour: Optional[float]
+
+
+class EnergyReport(NamedTuple):
+    timestamp: float
+    interval: float
+    discharge_rate: Optional[float]
+    top: List[ProcessEnergy]
+
+
+class ProcessEnergyCollector:
+    """Attributes the battery discharge rate to the processes using the most CPU.
+
+    Every interval it makes a single process_iter() pass, reading each
+    process's CPU times inside oneshot(), and diffs them against the previous
+    pass. Processes are keyed by (pid, create_time) so a reused pid never
+    inherits another process's counters; only live processes are kept, so
+    memory stays bounded. discharge_rate() should return percent per hour
+    while on battery and None otherwise.
+    """
+
+    def __init__(self, discharge_rate: Callable[[], Optional[float]] = lambda: None,
+                 interval: float = DEFAULT_INTERVAL, top_n: int = DEFAULT_TOP_N):
+        self.discharge_rate = discharge_rate
+        self.interval = interval
+        self.top_n = top_n
+        self.process_count = 0
+        self._cpu_times: Dict[Tuple[int, float], float] = {}
+        self._sampled_at = None
+        self._report: Optional[EnergyReport] = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def report(self) -> Optional[EnergyReport]:
+        return self._report
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="energy-attribution", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        # The first pass only records a baseline
+        delay = 0
+        while not self._stop.wait(delay):
+            delay = self.interval
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Process energy sampling failed: {e}")
+
+    def sample(self) -> Optional[EnergyReport]:
+        now = time.monotonic()
+        cpu_times = {}
+        deltas = []
+        for proc in psutil.process_iter():
+            try:
+                with proc.oneshot():
+                    key = (proc.pid, proc.create_time())
+                    times = proc.cpu_times()
+                    cpu = times.user + times.system
+                    previous = self._cpu_times.get(key)
+                    if previous is not None and cpu > previous:
+                        deltas.append((cpu - previous, proc.pid, proc.name()))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            cpu_times[key] = cpu
+        self._cpu_times = cpu_times
+        self.process_count = len(cpu_times)
+        previous_sample, self._sampled_at = self._sampled_at, now
+        if previous_sample is None:
+            return None
+
+        total = sum(delta for delta, _, _ in deltas)
+        rate = self.discharge_rate()
+        top = []
+        for delta, pid, name in heapq.nlargest(self.top_n, deltas):
+            share = delta / total if total else 0.0
+            top.append(ProcessEnergy(pid, name, delta, share, share * rate if rate is not None else None))
+        self._report = EnergyReport(time.time(), now - previous_sample, rate, top)
+        return self._report
@@ -0,0 +1,25 @@
+import os
+import sys
+from typing import IO, Optional
+
+
+def try_lock(path: str) -> Optional[IO]:
+    """Take an exclusive OS lock on path without blocking.
+
+    Returns the open lock file, which holds the lock until it is closed or
+    the process exits, or None when another process already holds it.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    lock_file = open(path, "a+")
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
@@ -0,0 +1,184 @@
+import datetime
+import glob
+import logging
+import mmap
+import os
+import struct
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+from file_lock import try_lock
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SMCH"
+VERSION = 1
+# timestamp (float64), percent (float32), secsleft (int32), plugged (uint8), padding
+RECORD = struct.Struct("<dfiB7x")
+# magic, version, record size, capacity, record count, day index entries
+HEADER = struct.Struct("<4sHHIII")
+DAY_ENTRY = struct.Struct("<II")  # day ordinal, index of the day's first record
+MAX_DAYS_PER_SEGMENT = 64
+HEADER_SIZE = 1024
+COUNT_OFFSET = 12
+DAYS_OFFSET = 16
+DAY_INDEX_OFFSET = HEADER.size
+
+DEFAULT_SEGMENT_RECORDS = 65536  # ~1.5 MB, about 3.8 days of 5-second samples
+DEFAULT_MAX_SEGMENTS = 16
+SEGMENT_PATTERN = "segment-*.smch"
+WRITER_LOCK = "writer.lock"
+
+
+def _day_ordinal(timestamp: float) -> int:
+    return datetime.date.fromtimestamp(timestamp).toordinal()
+
+
+class HistorySegment:
+    """One pre-sized, memory-mapped segment file of fixed-size records."""
+
+    def __init__(self, path: str, capacity: int = DEFAULT_SEGMENT_RECORDS):
+        self.path = path
+        size = HEADER_SIZE + capacity * RECORD.size
+        new = not os.path.exists(path) or os.path.getsize(path) < HEADER_SIZE
+        self._file = open(path, "r+b" if not new else "w+b")
+        if new:
+            self._file.truncate(size)
+        else:
+            size = os.path.getsize(path)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        if new:
+            HEADER.pack_into(self._mm, 0, MAGIC, VERSION, RECORD.size, capacity, 0, 0)
+        magic, version, record_size, self.capacity, self.count, self.days = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"Unrecognized history segment: {path}")
+        self._last_day = self.day_index()[-1][0] if self.days else None
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def day_index(self) -> List[Tuple[int, int]]:
+        return [DAY_ENTRY.unpack_from(self._mm, DAY_INDEX_OFFSET + i * DAY_ENTRY.size)
+                for i in range(self.days)]
+
+    def append(self, timestamp: float, percent: float, plugged: bool, secsleft: int):
+        day = _day_ordinal(timestamp)
+        if day != self._last_day and self.days < MAX_DAYS_PER_SEGMENT:
+            DAY_ENTRY.pack_into(self._mm, DAY_INDEX_OFFSET + self.days * DAY_ENTRY.size, day, self.count)
+            self.days += 1
+            self._last_day = day
+            struct.pack_into("<I", self._mm, DAYS_OFFSET, self.days)
+        RECORD.pack_into(self._mm, HEADER_SIZE + self.count * RECORD.size,
+                         timestamp, percent, max(-2 ** 31, min(secsleft, 2 ** 31 - 1)), 1 if plugged else 0)
+        # The count is written last so a crash never exposes a half-written record
+        self.count += 1
+        struct.pack_into("<I", self._mm, COUNT_OFFSET, self.count)
+
+    def record(self, i: int) -> tuple:
+        timestamp, percent, secsleft, plugged = RECORD.unpack_from(self._mm, HEADER_SIZE + i * RECORD.size)
+        return timestamp, percent, bool(plugged), secsleft
+
+    def records(self, start: int = 0) -> Iterator[tuple]:
+        for i in range(start, self.count):
+            yield self.record(i)
+
+    def first_record_of(self, day: int) -> Optional[int]:
+        """Index of the first record on or after the given day ordinal."""
+        index = self.day_index()
+        for entry_day, first in index:
+            if entry_day >= day:
+                return first
+        if self.days == MAX_DAYS_PER_SEGMENT:
+            # The index is full; later days start somewhere after its last entry
+            return index[-1][1]
+        return None
+
+    def flush(self):
+        self._mm.flush()
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+
+class HistoryLogBusy(RuntimeError):
+    """Another process has the history log open for writing."""
+
+
+class HistoryLog:
+    """Append-only on-disk battery history made of rotating mmap segments.
+
+    Opening the log maps the existing segments and reads only their headers,
+    so past samples are available immediately after a restart. Segment
+    record counts are cached per process, so only one process may have the
+    directory open at a time; a second one gets HistoryLogBusy.
+    """
+
+    def __init__(self, directory: str, segment_records: int = DEFAULT_SEGMENT_RECORDS,
+                 max_segments: int = DEFAULT_MAX_SEGMENTS):
+        self.directory = directory
+        self.segment_records = segment_records
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._writer_lock = try_lock(os.path.join(directory, WRITER_LOCK))
+        if self._writer_lock is None:
+            raise HistoryLogBusy(f"History log at {directory} is in use by another process")
+        self._segments: List[HistorySegment] = []
+        for path in sorted(glob.glob(os.path.join(directory, SEGMENT_PATTERN))):
+            try:
+                self._segments.append(HistorySegment(path))
+            except (OSError, ValueError) as e:
+                logger.error(f"Skipping history segment {path}: {e}")
+        if not self._segments:
+            self._rotate()
+        logger.info(f"History log opened at {directory} with {len(self)} samples.")
+
+    def __len__(self):
+        return sum(segment.count for segment in self._segments)
+
+    def _rotate(self):
+        number = 1
+        if self._segments:
+            number = int(os.path.basename(self._segments[-1].path)[8:-5]) + 1
+            self._segments[-1].flush()
+        path = os.path.join(self.directory, f"segment-{number:06d}.smch")
+        self._segments.append(HistorySegment(path, self.segment_records))
+        while len(self._segments) > self.max_segments:
+            oldest = self._segments.pop(0)
+            oldest.close()
+            os.remove(oldest.path)
+
+    def append(self, timestamp: float, percent: float, plugged: bool, secsleft: int):
+        with self._lock:
+            if self._segments[-1].full:
+                self._rotate()
+            self._segments[-1].append(timestamp, percent, plugged, secsleft)
+
+    def records(self, since: Optional[float] = None) -> Iterator[tuple]:
+        """Yield (timestamp, percent, plugged, secsleft) in order, using the day index to skip ahead."""
+        day = _day_ordinal(since) if since is not None else None
+        for segment in list(self._segments):
+            start = 0
+            if day is not None:
+                start = segment.first_record_of(day)
+                if start is None:
+                    continue
+            for record in segment.records(start):
+                if since is None or record[0] >= since:
+                    yield record
+
+    def flush(self):
+        with self._lock:
+            self._segments[-1].flush()
+
+    def close(self):
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+            if self._writer_lock:
+                self._writer_lock.close()
+                self._writer_lock = None
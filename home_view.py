@@ -0,0 +1,77 @@
+import collections
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_CACHE_SIZE = 256
+
+
+class HomeView(NamedTuple):
+    percent_text: str
+    status_lines: Tuple[str, ...]
+
+
+class HomeViewModel:
+    """Formats the home page text for a battery reading, memoized per (percent, plugged, secsleft).
+
+    format_time is called with the battery snapshot to build the time
+    estimate line. When that text also depends on other state, such as a
+    learned charge profile, generation returns a counter that changes with
+    it and becomes part of the key. Equal keys return the very same
+    HomeView object, so callers can skip rendering with an identity check.
+    """
+
+    def __init__(self, format_time: Callable[[object], str], maxsize: int = DEFAULT_CACHE_SIZE,
+                 generation: Optional[Callable[[], int]] = None):
+        self.format_time = format_time
+        self.maxsize = maxsize
+        self.generation = generation
+        self._cache = collections.OrderedDict()
+
+    def view(self, battery) -> HomeView:
+        key = (battery.percent, battery.power_plugged, battery.secsleft) if battery else None
+        if key and self.generation:
+            key += (self.generation(),)
+        view = self._cache.get(key)
+        if view is not None:
+            self._cache.move_to_end(key)
+            return view
+        view = self._format(battery)
+        self._cache[key] = view
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return view
+
+    def clear(self):
+        self._cache.clear()
+
+    def _format(self, battery) -> HomeView:
+        if not battery:
+            return HomeView("0%", ("Status: Discharging", "Power Plugged: N/A",
+                                   "Time to Full Charge: N/A", "Time to Complete Discharge: N/A"))
+        plugged = battery.power_plugged
+        time_text = self.format_time(battery)
+        return HomeView(f"{battery.percent:.0f}%", (
+            "Status: Charging" if plugged else "Status: Discharging",
+            f"Power Plugged: {plugged}",
+            f"Time to Full Charge: {time_text}" if plugged else "Time to Full Charge: N/A",
+            f"Time to Complete Discharge: {time_text}" if not plugged else "Time to Complete Discharge: N/A",
+        ))
+
+
+class LabelBinding:
+    """Remembers the text last written to each label and only reconfigures labels that change."""
+
+    def __init__(self, labels: Sequence = ()):
+        self.bind(labels)
+
+    def bind(self, labels: Sequence):
+        self.labels = list(labels)
+        self._texts: list = [None] * len(self.labels)
+
+    def render(self, texts: Sequence[str]) -> int:
+        changed = 0
+        for i, (label, text) in enumerate(zip(self.labels, texts)):
+            if self._texts[i] != text:
+                label.configure(text=text)
+                self._texts[i] = text
+                changed += 1
+        return changed
@@ -0,0 +1,128 @@
+import collections
+import hashlib
+import logging
+import os
+import threading
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from lazy_import import LazyModule
+
+ImageTk = LazyModule("PIL.ImageTk")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), "AppData", "Local", "SaveMyCell", "image_cache")
+
+
+class CachedImage:
+    def __init__(self, image: Image.Image):
+        self.image = image
+        self.photo = None
+        self.nbytes = image.width * image.height * 4
+
+
+class ImageCache:
+    """Scaled images keyed by (path, mtime, file size, target size), in memory and on disk.
+
+    Memory holds the scaled PIL image plus its PhotoImage, evicting least
+    recently used entries once max_bytes is exceeded. Every scaled image is
+    also written to cache_dir as a PNG, so after a restart it is loaded
+    without opening or resampling the original. Editing the source file
+    changes its mtime and size, which misses the cache and replaces the
+    stale PNG. fit=True keeps the aspect ratio inside the target box.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        if cache_dir:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as e:
+                logger.warning(f"Image cache directory {cache_dir} unavailable, caching in memory only: {e}")
+                self.cache_dir = None
+
+    def image(self, path: str, size: Tuple[int, int], fit: bool = False) -> Image.Image:
+        """Scaled image for path; raises OSError if the source cannot be read."""
+        return self._entry(path, size, fit).image
+
+    def photo(self, path: str, size: Tuple[int, int], fit: bool = False):
+        """Tk image for path; must be called on the Tk thread."""
+        entry = self._entry(path, size, fit)
+        if entry.photo is None:
+            entry.photo = ImageTk.PhotoImage(entry.image)
+        return entry.photo
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _entry(self, path: str, size: Tuple[int, int], fit: bool) -> CachedImage:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size, tuple(size), fit)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = CachedImage(self._load(key))
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self._bytes += entry.nbytes
+                while self._bytes > self.max_bytes and len(self._entries) > 1:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= evicted.nbytes
+            return self._entries[key]
+
+    def _disk_paths(self, key) -> Tuple[str, str]:
+        path, mtime_ns, file_size, size, fit = key
+        prefix = hashlib.sha1(f"{path}|{size[0]}x{size[1]}|{fit}".encode("utf-8")).hexdigest()[:16]
+        return prefix, os.path.join(self.cache_dir, f"{prefix}-{mtime_ns}-{file_size}.png")
+
+    def _load(self, key) -> Image.Image:
+        if self.cache_dir:
+            prefix, cached_path = self._disk_paths(key)
+            try:
+                with Image.open(cached_path) as cached:
+                    cached.load()
+                    return cached.copy()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Discarding unreadable cached image {cached_path}: {e}")
+
+        path, _, _, size, fit = key
+        with Image.open(path) as source:
+            image = source.convert("RGBA")
+        if fit:
+            ratio = min(size[0] / image.width, size[1] / image.height)
+            target = (max(1, int(image.width * ratio)), max(1, int(image.height * ratio)))
+        else:
+            target = size
+        image = image.resize(target, Image.Resampling.LANCZOS)
+        if self.cache_dir:
+            self._store(prefix, cached_path, image)
+        return image
+
+    def _store(self, prefix: str, cached_path: str, image: Image.Image):
+        partial_path = f"{cached_path}.partial"
+        try:
+            image.save(partial_path, format="PNG")
+            os.replace(partial_path, cached_path)
+            # Drop PNGs scaled from earlier versions of the same file
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(prefix + "-") and os.path.join(self.cache_dir, name) != cached_path:
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError as e:
+            logger.warning(f"Failed to persist scaled image to {cached_path}: {e}")
+
@@ -0,0 +1,78 @@
+import importlib
+import threading
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access.
+
+    Keeps heavy or rarely used dependencies off the startup path. An
+    ImportError for a missing module surfaces at that first use rather
+    than at import time, so callers should handle it where they already
+    handle the feature being unavailable.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                self.__dict__["_module"] = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._module or self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+class LazyObject:
+    """Stands in for a shared object and builds it on first attribute access.
+
+    factory is a callable or a "module:attribute" string naming one, so
+    the defining module is not imported until the object is needed either.
+    """
+
+    def __init__(self, factory, *args, **kwargs):
+        self.__dict__["_factory"] = factory
+        self.__dict__["_args"] = (args, kwargs)
+        self.__dict__["_object"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def _get(self):
+        if self._object is not None:
+            return self._object
+        with self._lock:
+            if self._object is None:
+                factory = self._factory
+                if isinstance(factory, str):
+                    module_name, attr = factory.split(":")
+                    factory = getattr(importlib.import_module(module_name), attr)
+                args, kwargs = self._args
+                self.__dict__["_object"] = factory(*args, **kwargs)
+        return self._object
+
+    @property
+    def loaded(self) -> bool:
+        return self._object is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._get(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._get(), attr, value)
+
+    def __len__(self):
+        return len(self._get())
+
+    def __repr__(self):
+        state = repr(self._object) if self._object is not None else "not built"
+        return f"<LazyObject {state}>"
@@ -4,6 +4,9 @@ from tkinter import ttk
 import tkinter as tk
 from PIL import Image, ImageTk
 from utils import get_system_details
+from charge_estimator import shared_estimator
+from network_status import NetworkStatusProvider
+from energy_attribution import ProcessEnergyCollector
 import threading
 import time
 import queue
@@ -43,6 +46,9 @@ SETTINGS_FILE = os.path.join(os.path.expanduser(
 if not os.path.exists(os.path.dirname(SETTINGS_FILE)):
     os.makedirs(os.path.dirname(SETTINGS_FILE))
 
+network_status_provider = NetworkStatusProvider()
+process_energy = ProcessEnergyCollector()
+
 # --- Utility functions from savemycell.py ---
 
 
@@ -58,9 +64,7 @@ def calculate_battery_time(battery):
     if battery.power_plugged:
         current_percent = battery.percent
         remaining_percent = 100 - current_percent
-        charging_rate = 40.0 + (60.0 - 40.0) * (1 - current_percent / 100)
-        hours_to_full = remaining_percent / charging_rate
-        total_seconds = int(hours_to_full * 3600)
+        total_seconds = int(shared_estimator().seconds_to_full(current_percent))
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
         return f"Time to Full Charge: {hours}h {minutes}m" if remaining_percent > 0 else "Time to Full Charge: Fully Charged"
@@ -125,11 +129,10 @@ def get_diagnostic_sections():
     storage_usage = f"Storage Usage: {disk.used / 1e9:.1f} GB / {disk.total / 1e9:.1f} GB"
 
     # Network
-    network_status = "Connected" if socket.gethostbyname(
-        socket.gethostname()) else "Disconnected"
+    network_status = network_status_provider.describe()
 
     # Background processes
-    num_procs = len(list(psutil.process_iter()))
+    num_procs = process_energy.process_count
     print("Background Processes:", num_procs)
 
     battery_summary = get_battery_summary()
@@ -256,6 +259,7 @@ class SaveMyCellApp:
         self.monitor_thread = threading.Thread(
             target=self.battery_monitor_loop, daemon=True)
         self.monitor_thread.start()
+        process_energy.start()
         self.root.after(1000, self.check_theme_change)
         self.root.after(500, self.check_prompt_queue)
 
@@ -0,0 +1,338 @@
+"""Headless battery monitor.
+
+Watches the battery without loading Tk or CustomTkinter and launches the
+small unplug_prompt.py process when the threshold is reached. Its tray
+icon shows the charge level and opens the app; --no-tray runs it without
+pystray or Pillow.
+Both hold the same monitor lock, so at most one of them monitors: the
+app finds a running daemon over daemon_ipc and acts as a short-lived
+viewer, and the daemon exits while the app is monitoring. Autostart
+launches it as `smc.py --daemon`.
+
+    python monitor_daemon.py [--state-dir DIR] [--no-tray]
+"""
+import argparse
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+from battery_snapshot import BatterySampler
+from charge_estimator import PROFILE_FILE, ChargeTimeEstimator
+from daemon_ipc import DEFAULT_STATE_DIR, DaemonServer
+from history_log import HistoryLog
+from power_events import open_power_event_source
+from sampling_scheduler import ThresholdScheduler
+from single_instance import MONITOR_INSTANCE, SingleInstance
+from sysfs_battery import open_sysfs_battery_reader
+
+logger = logging.getLogger(__name__)
+
+UNPLUG_THRESHOLD = 90
+REFRESH_INTERVAL = 120
+POWER_SAVING_REFRESH_INTERVAL = 600
+PROMPT_TIMEOUT = 30
+UNPLUG_PROMPT_COOLDOWN = 300
+POWER_EVENT_FALLBACK_INTERVAL = 600
+UNAVAILABLE_RETRY_INTERVAL = 10
+PROMPT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "unplug_prompt.py")
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "smc.py")
+
+
+class DaemonSettings:
+    """The app's settings.json, re-read whenever the file changes on disk."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.unplug_threshold = UNPLUG_THRESHOLD
+        self.refresh_interval = REFRESH_INTERVAL
+        self.power_saving_mode = False
+        self._mtime = None
+
+    def reload_if_changed(self) -> bool:
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        try:
+            with open(self.path, "r") as f:
+                settings = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to read settings from {self.path}: {e}")
+            return False
+        self.unplug_threshold = settings.get("unplug_threshold", UNPLUG_THRESHOLD)
+        self.refresh_interval = settings.get("refresh_interval", REFRESH_INTERVAL)
+        self.power_saving_mode = settings.get("power_saving_mode", False)
+        logger.info(f"Settings loaded: threshold={self.unplug_threshold}, "
+                    f"refresh={self.refresh_interval}, power_saving={self.power_saving_mode}")
+        return True
+
+
+class MonitorDaemon:
+    """The monitoring loop of the app without any UI, serving status over IPC.
+
+    Commands: "status" returns the latest reading and settings, "stop"
+    shuts the daemon down. Subscribers receive a "battery" event whenever
+    the percentage, charging state or time estimate changes; on_battery,
+    if given, is called with every reading from the monitor thread.
+    """
+
+    def __init__(self, state_dir: str = DEFAULT_STATE_DIR, sampler: Optional[BatterySampler] = None,
+                 events=None, prompt_command=None, on_battery: Optional[Callable] = None):
+        self.state_dir = state_dir
+        self.settings = DaemonSettings(os.path.join(state_dir, "settings.json"))
+        self.sampler = sampler or BatterySampler(reader=open_sysfs_battery_reader())
+        self.events = events
+        self.on_battery = on_battery
+        self.prompt_command = prompt_command or [sys.executable, PROMPT_SCRIPT, "--timeout", str(PROMPT_TIMEOUT)]
+        self.scheduler = ThresholdScheduler(max_interval=POWER_SAVING_REFRESH_INTERVAL)
+        # The learned charge profile lives in the state directory along with the history it was learned from
+        self.estimator = ChargeTimeEstimator(os.path.join(state_dir, PROFILE_FILE))
+        self.estimator.load()
+        self.server = DaemonServer({"status": self.handle_status, "stop": self.handle_stop}, state_dir)
+        try:
+            self.history_log = HistoryLog(os.path.join(state_dir, "history"))
+        except Exception as e:
+            logger.error(f"Failed to open history log: {e}")
+            self.history_log = None
+        self.last_battery = None
+        self.last_unplug_prompt_time = 0
+        self._prompt = None
+        self._wake = threading.Event()
+        self._stopping = False
+
+    @property
+    def prompt_active(self) -> bool:
+        return self._prompt is not None and self._prompt.poll() is None
+
+    def handle_status(self, request) -> dict:
+        battery = self.last_battery
+        return {
+            "ok": True,
+            "battery": battery._asdict() if battery else None,
+            "unplug_threshold": self.settings.unplug_threshold,
+            "prompt_active": self.prompt_active,
+            "pid": os.getpid(),
+        }
+
+    def handle_stop(self, request) -> dict:
+        self.stop()
+        return {"ok": True}
+
+    def stop(self):
+        self._stopping = True
+        self._wake.set()
+
+    def run(self):
+        self.server.start()
+        if self.events:
+            threading.Thread(target=self._forward_events, name="power-events", daemon=True).start()
+        self.restore_estimator()
+        try:
+            while not self._stopping:
+                try:
+                    interval = self.step()
+                except Exception as e:
+                    logger.error(f"Monitor error: {e}")
+                    interval = UNAVAILABLE_RETRY_INTERVAL
+                self._wake.wait(interval)
+                self._wake.clear()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        logger.info("Monitoring daemon shutting down.")
+        self.server.close()
+        if self.events:
+            self.events.close()
+        if self.history_log:
+            self.history_log.close()
+
+    def _forward_events(self):
+        while not self._stopping:
+            event = self.events.wait(POWER_EVENT_FALLBACK_INTERVAL)
+            if event:
+                logger.info(f"Power event '{event.kind}' from {event.device or 'unknown device'}, waking monitor.")
+                self._wake.set()
+
+    def restore_estimator(self):
+        if not self.history_log:
+            return
+        try:
+            estimator = self.estimator
+            for timestamp, percent, plugged, _ in self.history_log.records(since=estimator.learned_until):
+                estimator.observe(timestamp, percent, plugged)
+            estimator.end_session()
+            if estimator.dirty:
+                estimator.save()
+        except Exception as e:
+            logger.error(f"Failed to replay battery history: {e}")
+
+    def step(self) -> float:
+        """Take one sample, act on it and return the seconds until the next one."""
+        self.settings.reload_if_changed()
+        battery = self.sampler.sample()
+        if not battery:
+            logger.warning("Battery status unavailable.")
+            return UNAVAILABLE_RETRY_INTERVAL
+        now = time.time()
+        threshold = self.settings.unplug_threshold
+        if self.history_log:
+            self.history_log.append(battery.timestamp, battery.percent, battery.power_plugged, battery.secsleft)
+        estimator = self.estimator
+        estimator.observe(battery.timestamp, battery.percent, battery.power_plugged)
+        if estimator.dirty and not battery.power_plugged:
+            estimator.save()
+        self.scheduler.observe(battery.timestamp, battery.percent, battery.power_plugged)
+
+        if battery.percent >= threshold and battery.power_plugged:
+            if not self.prompt_active:
+                if self.last_battery and not self.last_battery.power_plugged:
+                    logger.info("Charger replugged above threshold, showing prompt...")
+                    self.show_prompt()
+                elif not self.last_unplug_prompt_time or now - self.last_unplug_prompt_time >= UNPLUG_PROMPT_COOLDOWN:
+                    logger.info("Showing unplug prompt...")
+                    self.show_prompt()
+                    self.last_unplug_prompt_time = now
+        elif self.last_battery and not battery.power_plugged and self.last_battery.power_plugged:
+            if battery.percent < threshold:
+                self.last_unplug_prompt_time = 0
+
+        previous, self.last_battery = self.last_battery, battery
+        if previous is None or previous[:3] != battery[:3]:
+            self.server.publish({"event": "battery", "battery": battery._asdict()})
+        if self.on_battery:
+            self.on_battery(battery)
+        return self.next_interval(battery, now)
+
+    def next_interval(self, battery, now: float) -> float:
+        threshold = self.settings.unplug_threshold
+        if self.settings.power_saving_mode:
+            interval = POWER_SAVING_REFRESH_INTERVAL
+        elif battery.power_plugged and battery.percent >= threshold:
+            interval = 5
+        else:
+            interval = self.settings.refresh_interval
+        interval = self.scheduler.next_interval(battery.percent, battery.power_plugged, threshold, interval)
+        if self.events:
+            # Plug and unplug wake the loop, so polling only covers charging progress and the cooldown
+            if not battery.power_plugged:
+                interval = max(interval, POWER_EVENT_FALLBACK_INTERVAL)
+            elif battery.percent >= threshold and self.last_unplug_prompt_time:
+                interval = max(interval, UNPLUG_PROMPT_COOLDOWN - (now - self.last_unplug_prompt_time))
+        return interval
+
+    def show_prompt(self):
+        try:
+            self._prompt = subprocess.Popen(self.prompt_command)
+        except OSError as e:
+            logger.error(f"Failed to launch unplug prompt: {e}")
+
+
+class DaemonTray:
+    """Tray icon of the daemon: shows the charge level, opens the app and stops monitoring.
+
+    pystray and the icon renderer are imported here rather than at module
+    level so --no-tray keeps the daemon free of them.
+    """
+
+    def __init__(self, daemon: MonitorDaemon):
+        import pystray
+        from PIL import Image
+        from tray_icon import DEFAULT_ICON_SIZE, TrayIconRenderer
+
+        self.daemon = daemon
+        self.renderer = TrayIconRenderer()
+        self.icon_key = None
+        menu = pystray.Menu(
+            pystray.MenuItem("Open Save My Cell", lambda: self.open_app(), default=True),
+            pystray.MenuItem("Exit", lambda: self.daemon.stop())
+        )
+        placeholder = Image.new("RGBA", (DEFAULT_ICON_SIZE, DEFAULT_ICON_SIZE), (245, 245, 245, 255))
+        self.icon = pystray.Icon("SaveMyCell", placeholder, "Save My Cell", menu)
+
+    @staticmethod
+    def app_command():
+        if getattr(sys, 'frozen', False):
+            return [sys.executable]
+        return [sys.executable, APP_SCRIPT]
+
+    def open_app(self):
+        # A second click lands on the running app's single-instance hand-off and restores it
+        try:
+            subprocess.Popen(self.app_command())
+        except OSError as e:
+            logger.error(f"Failed to launch the app: {e}")
+
+    @staticmethod
+    def is_dark() -> bool:
+        try:
+            import darkdetect
+            return bool(darkdetect.isDark())
+        except Exception:
+            return False
+
+    def update(self, battery):
+        """Redraw only when the percent, charging state or theme changes."""
+        key = self.renderer.frame_key(battery, self.is_dark())
+        if key == self.icon_key:
+            return
+        self.icon_key = key
+        try:
+            self.icon.icon = self.renderer.frame(*key)
+            self.icon.title = f"Save My Cell - {key[0]}%{' (charging)' if key[1] else ''}"
+        except Exception as e:
+            logger.error(f"Failed to update tray icon: {e}")
+
+    def start(self):
+        threading.Thread(target=self.icon.run, name="tray", daemon=True).start()
+
+    def stop(self):
+        try:
+            self.icon.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop tray icon: {e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless Save My Cell battery monitor")
+    parser.add_argument("--state-dir", default=DEFAULT_STATE_DIR)
+    parser.add_argument("--no-tray", action="store_true", help="run without a tray icon")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.state_dir, exist_ok=True)
+    logging.basicConfig(filename=os.path.join(args.state_dir, "SaveMyCellDaemon.log"), level=logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    instance = SingleInstance(MONITOR_INSTANCE, args.state_dir)
+    if not instance.acquire():
+        logger.info("The battery is already monitored by the app or another daemon, exiting.")
+        return
+    daemon = MonitorDaemon(args.state_dir, events=open_power_event_source())
+    tray = None
+    if not args.no_tray:
+        try:
+            tray = DaemonTray(daemon)
+        except Exception as e:
+            logger.warning(f"No tray icon available, monitoring without one: {e}")
+    if tray:
+        daemon.on_battery = tray.update
+        tray.start()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: daemon.stop())
+    try:
+        daemon.run()
+    finally:
+        if tray:
+            tray.stop()
+
+
+if __name__ == "__main__":
+    main()
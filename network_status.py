@@ -0,0 +1,84 @@
+import ipaddress
+import logging
+import socket
+import threading
+import time
+from typing import NamedTuple, Optional, Tuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 30
+
+
+class NetworkState(NamedTuple):
+    connected: bool
+    interfaces: Tuple[str, ...]
+    timestamp: float
+
+
+def _is_routable(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address.split("%")[0])
+    except ValueError:
+        return False
+    return not (ip.is_loopback or ip.is_link_local or ip.is_unspecified)
+
+
+def probe_network() -> NetworkState:
+    """Connected means some interface is up and has a non-loopback, non-link-local address."""
+    stats = psutil.net_if_stats()
+    addresses = psutil.net_if_addrs()
+    connected = []
+    for name, nic_stats in stats.items():
+        if not nic_stats.isup:
+            continue
+        for address in addresses.get(name, ()):
+            if address.family in (socket.AF_INET, socket.AF_INET6) and _is_routable(address.address):
+                connected.append(name)
+                break
+    return NetworkState(bool(connected), tuple(connected), time.time())
+
+
+class NetworkStatusProvider:
+    """TTL-cached network state, refreshed off the calling thread.
+
+    get() returns the cached state without blocking and starts a background
+    probe when it is older than ttl seconds.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._state: Optional[NetworkState] = None
+        self._probed_at = None
+        self._refreshing = False
+
+    def get(self) -> Optional[NetworkState]:
+        if self._probed_at is None or time.monotonic() - self._probed_at >= self.ttl:
+            self.refresh()
+        return self._state
+
+    def refresh(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._probe, name="network-probe", daemon=True).start()
+
+    def _probe(self):
+        try:
+            self._state = probe_network()
+        except Exception as e:
+            logger.error(f"Network probe failed: {e}")
+        finally:
+            with self._lock:
+                self._probed_at = time.monotonic()
+                self._refreshing = False
+
+    def describe(self) -> str:
+        state = self.get()
+        if state is None:
+            return "Checking..."
+        return "Connected" if state.connected else "Disconnected"
@@ -0,0 +1,155 @@
+import logging
+import queue
+import select
+import socket
+import sys
+import time
+from typing import Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+NETLINK_KOBJECT_UEVENT = 15
+KERNEL_UEVENT_GROUP = 1
+UEVENT_BUFFER_SIZE = 16384
+
+# Event kinds, in order of precedence when several arrive together
+PLUG = "plug"
+UNPLUG = "unplug"
+CAPACITY = "capacity"
+CHANGE = "change"
+_PRECEDENCE = {PLUG: 0, UNPLUG: 0, CAPACITY: 1, CHANGE: 2}
+
+
+class PowerEvent(NamedTuple):
+    kind: str
+    device: str
+    attrs: Dict[str, str]
+
+
+def parse_uevent(data: bytes) -> Optional[PowerEvent]:
+    """Turn a raw kernel uevent into a PowerEvent, or None if it is not power_supply."""
+    parts = data.split(b"\0")
+    if not parts or b"@" not in parts[0]:
+        return None
+    env = {}
+    for part in parts[1:]:
+        key, sep, value = part.partition(b"=")
+        if sep:
+            env[key.decode(errors="replace")] = value.decode(errors="replace")
+    if env.get("SUBSYSTEM") != "power_supply":
+        return None
+    device = env.get("POWER_SUPPLY_NAME", "")
+    online = env.get("POWER_SUPPLY_ONLINE")
+    if online is not None and env.get("POWER_SUPPLY_TYPE") != "Battery":
+        kind = PLUG if online == "1" else UNPLUG
+    elif "POWER_SUPPLY_CAPACITY" in env:
+        kind = CAPACITY
+    else:
+        kind = CHANGE
+    return PowerEvent(kind, device, env)
+
+
+class NetlinkPowerEventSource:
+    """Kernel power_supply uevents read from a NETLINK_KOBJECT_UEVENT socket."""
+
+    def __init__(self):
+        self._sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+        try:
+            self._sock.bind((0, KERNEL_UEVENT_GROUP))
+            self._sock.setblocking(False)
+        except OSError:
+            self._sock.close()
+            raise
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def wait(self, timeout: float) -> Optional[PowerEvent]:
+        """Block until a power event arrives or timeout seconds pass.
+
+        Events that arrive in the same burst (an AC adapter and its battery
+        usually report together) are coalesced into the most significant one.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([self._sock], [], [], remaining)
+            if not ready:
+                return None
+            event = self._drain()
+            if event:
+                return event
+
+    def _drain(self) -> Optional[PowerEvent]:
+        best = None
+        while True:
+            try:
+                data = self._sock.recv(UEVENT_BUFFER_SIZE)
+            except (BlockingIOError, InterruptedError):
+                return best
+            event = parse_uevent(data)
+            if event and (best is None or _PRECEDENCE[event.kind] < _PRECEDENCE[best.kind]):
+                best = event
+
+    def close(self):
+        self._sock.close()
+
+
+class FakePowerEventSource:
+    """In-process event source for tests and platforms without netlink."""
+
+    def __init__(self):
+        self._events = queue.Queue()
+
+    def emit(self, kind: str, device: str = "AC", **attrs):
+        self._events.put(PowerEvent(kind, device, attrs))
+
+    def wait(self, timeout: float) -> Optional[PowerEvent]:
+        try:
+            return self._events.get(timeout=max(0, timeout))
+        except queue.Empty:
+            return None
+
+    def close(self):
+        pass
+
+
+def open_power_event_source():
+    """Return the best event source for this platform, or None to fall back to polling."""
+    if not sys.platform.startswith("linux") or not hasattr(socket, "AF_NETLINK"):
+        return None
+    try:
+        source = NetlinkPowerEventSource()
+        logger.info("Subscribed to kernel power_supply uevents.")
+        return source
+    except OSError as e:
+        logger.warning(f"Netlink uevents unavailable, falling back to polling: {e}")
+        return None
+
+
+def event_driven_interval(interval: float, plugged: bool, above_threshold: bool, since_prompt: Optional[float],
+                          fallback: float, cooldown: float) -> float:
+    """Stretch a polling interval when plug and unplug arrive as events.
+
+    Polling then only has to cover what events cannot: charging progress
+    and the end of the prompt cooldown (since_prompt is None when no
+    prompt is pending).
+    """
+    if not plugged:
+        return max(interval, fallback)
+    if above_threshold and since_prompt is not None:
+        return max(interval, cooldown - since_prompt)
+    return interval
+
+
+def wait_for_power_event(events, timeout: float) -> Optional[PowerEvent]:
+    """Sleep for timeout seconds, returning early with the event if a source is given and one arrives."""
+    if not events:
+        time.sleep(timeout)
+        return None
+    event = events.wait(timeout)
+    if event:
+        logger.info(f"Power event '{event.kind}' from {event.device or 'unknown device'}, waking monitor.")
+    return event
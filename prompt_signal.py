@@ -0,0 +1,41 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+PROMPT_EVENT = "<<UnplugPromptRequested>>"
+
+
+class PromptSignal:
+    """Coalesced, thread-safe request for the Tk thread to show the unplug prompt.
+
+    The monitor thread calls post(); at most one virtual event is in flight
+    at a time, so repeated posts while the UI is busy collapse into one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = False
+        self._root = None
+
+    def attach(self, root, handler):
+        self._root = root
+        root.bind(PROMPT_EVENT, handler)
+
+    def post(self):
+        with self._lock:
+            if self._pending or self._root is None:
+                return
+            self._pending = True
+        try:
+            self._root.event_generate(PROMPT_EVENT, when="tail")
+        except Exception as e:
+            logger.error(f"Failed to post unplug prompt request: {e}")
+            self.consume()
+
+    def consume(self) -> bool:
+        """Clear the pending request; returns whether one was pending."""
+        with self._lock:
+            pending = self._pending
+            self._pending = False
+            return pending
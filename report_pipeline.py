@@ -0,0 +1,138 @@
+import collections
+import hashlib
+import logging
+import os
+import shlex
+import subprocess
+import threading
+import time
+from typing import Callable, List, Optional
+
+from battery_report import parse_battery_report
+from lazy_import import LazyModule
+
+asyncio = LazyModule("asyncio")
+
+logger = logging.getLogger(__name__)
+
+REPORT_COMMAND_ENV = "SAVEMYCELL_REPORT_COMMAND"
+DEFAULT_REPORT_COMMAND = ["powercfg", "/batteryreport", "/output", "{output}"]
+DEFAULT_TIMEOUT = 60
+DEFAULT_TTL = 6 * 3600
+RETRY_INTERVAL = 300
+CACHE_SIZE = 4
+EMPTY_METRICS = {
+    "design_capacity": None,
+    "full_charge_capacity": None,
+    "cycle_count": None
+}
+
+
+def default_report_command() -> List[str]:
+    """powercfg, unless SAVEMYCELL_REPORT_COMMAND names a stand-in (e.g. a stub script on Linux)."""
+    override = os.environ.get(REPORT_COMMAND_ENV)
+    return shlex.split(override) if override else list(DEFAULT_REPORT_COMMAND)
+
+
+class BatteryReportJob:
+    """Regenerates the battery report in the background and caches its parsed metrics.
+
+    The report command runs as an asyncio subprocess with a timeout and
+    writes to a partial file that is renamed over the report only on
+    success. Parsed metrics are cached by content hash, and metrics()
+    returns immediately, starting a refresh once the last one is older
+    than ttl seconds. "{output}" in the command is replaced with the path
+    the command must write to.
+    """
+
+    def __init__(self, report_path: str, command: Optional[List[str]] = None,
+                 timeout: float = DEFAULT_TIMEOUT, ttl: float = DEFAULT_TTL):
+        self.report_path = os.path.abspath(report_path)
+        self.command = command or default_report_command()
+        self.timeout = timeout
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._running = False
+        self._metrics = None
+        self._refreshed_at = None
+        self._attempted_at = None
+        self._cache = collections.OrderedDict()
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def metrics(self) -> dict:
+        """Latest parsed metrics, refreshing in the background when stale."""
+        if self._metrics is None and os.path.exists(self.report_path):
+            try:
+                # Reuse a report left by a previous run, aged by its mtime
+                age = time.time() - os.path.getmtime(self.report_path)
+                self._ingest(time.monotonic() - age)
+            except Exception as e:
+                logger.error(f"Failed to read existing battery report: {e}")
+        now = time.monotonic()
+        stale = self._refreshed_at is None or now - self._refreshed_at >= self.ttl
+        if stale and (self._attempted_at is None or now - self._attempted_at >= RETRY_INTERVAL):
+            self.refresh()
+        return dict(self._metrics or EMPTY_METRICS)
+
+    def refresh(self, on_done: Optional[Callable[[bool], None]] = None) -> bool:
+        """Start regenerating the report; returns False if a refresh is already running."""
+        with self._lock:
+            if self._running:
+                return False
+            self._running = True
+            self._attempted_at = time.monotonic()
+        threading.Thread(target=self._run, args=(on_done,), daemon=True).start()
+        return True
+
+    def _run(self, on_done):
+        ok = False
+        try:
+            asyncio.run(self._generate())
+            self._ingest(time.monotonic())
+            ok = True
+            logger.info(f"Battery report regenerated at {self.report_path}")
+        except Exception as e:
+            logger.error(f"Battery report generation failed: {e}")
+        finally:
+            with self._lock:
+                self._running = False
+            if on_done:
+                on_done(ok)
+
+    async def _generate(self):
+        partial_path = self.report_path + ".partial.html"
+        args = [arg.replace("{output}", partial_path) for arg in self.command]
+        process = await asyncio.create_subprocess_exec(*args, stdout=subprocess.DEVNULL,
+                                                       stderr=subprocess.DEVNULL)
+        try:
+            await asyncio.wait_for(process.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise TimeoutError(f"{args[0]} did not finish within {self.timeout}s")
+        if process.returncode != 0:
+            raise RuntimeError(f"{args[0]} exited with status {process.returncode}")
+        os.replace(partial_path, self.report_path)
+
+    def _ingest(self, refreshed_at: float):
+        digest = hashlib.sha256()
+        with open(self.report_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        key = digest.hexdigest()
+        with self._lock:
+            metrics = self._cache.get(key)
+            if metrics is not None:
+                self._cache.move_to_end(key)
+        if metrics is None:
+            metrics = parse_battery_report(self.report_path)
+            with self._lock:
+                self._cache[key] = metrics
+                while len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        with self._lock:
+            self._metrics = metrics
+            self._refreshed_at = refreshed_at
@@ -0,0 +1,65 @@
+import collections
+from typing import Optional
+
+DEFAULT_WINDOW = 12
+DEFAULT_LEAD_TIME = 30
+DEFAULT_DENSE_INTERVAL = 5
+DEFAULT_MAX_INTERVAL = 600
+DEFAULT_SAFETY_MARGIN = 0.2
+
+
+class ThresholdScheduler:
+    """Chooses the monitor's next sleep from a predicted threshold crossing.
+
+    While charging, the charge rate is fitted over the last few samples and
+    the monitor sleeps until shortly before unplug_threshold should be
+    reached, then samples every dense_interval seconds around the crossing.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, lead_time: float = DEFAULT_LEAD_TIME,
+                 dense_interval: float = DEFAULT_DENSE_INTERVAL,
+                 max_interval: float = DEFAULT_MAX_INTERVAL,
+                 safety_margin: float = DEFAULT_SAFETY_MARGIN):
+        self.lead_time = lead_time
+        self.dense_interval = dense_interval
+        self.max_interval = max_interval
+        self.safety_margin = safety_margin
+        self._samples = collections.deque(maxlen=window)
+        self._plugged = None
+
+    def observe(self, timestamp: float, percent: float, plugged: bool):
+        if plugged != self._plugged:
+            # A new charging (or discharging) session; old samples describe a different slope
+            self._samples.clear()
+            self._plugged = plugged
+        self._samples.append((timestamp, percent))
+
+    def charge_rate(self) -> Optional[float]:
+        """Least-squares charge rate in percent per second, or None without enough data."""
+        if len(self._samples) < 2:
+            return None
+        n = len(self._samples)
+        mean_t = sum(t for t, _ in self._samples) / n
+        mean_p = sum(p for _, p in self._samples) / n
+        var_t = sum((t - mean_t) ** 2 for t, _ in self._samples)
+        if var_t == 0:
+            return None
+        return sum((t - mean_t) * (p - mean_p) for t, p in self._samples) / var_t
+
+    def seconds_to_threshold(self, percent: float, threshold: float) -> Optional[float]:
+        rate = self.charge_rate()
+        if not self._plugged or rate is None or rate <= 0:
+            return None
+        return max(0.0, (threshold - percent) / rate)
+
+    def next_interval(self, percent: float, plugged: bool, threshold: float, fallback: float) -> float:
+        """Return how long to sleep; fallback is used whenever no crossing can be predicted."""
+        if not plugged or percent >= threshold:
+            return fallback
+        eta = self.seconds_to_threshold(percent, threshold)
+        if eta is None:
+            return fallback
+        wake_in = eta * (1 - self.safety_margin) - self.lead_time
+        if wake_in <= self.dense_interval:
+            return self.dense_interval
+        return min(wake_in, self.max_interval)
@@ -0,0 +1,65 @@
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+from daemon_ipc import DEFAULT_STATE_DIR, DaemonClient, DaemonServer, Handler
+from file_lock import try_lock
+
+logger = logging.getLogger(__name__)
+
+HANDOFF_WAIT = 5.0
+HANDOFF_RETRY = 0.1
+# Held by whichever process samples the battery and prompts: the app or monitor_daemon.py
+MONITOR_INSTANCE = "savemycell-monitor"
+
+
+class SingleInstance:
+    """Per-user lock plus an IPC endpoint through which later launches reach the owner.
+
+    The lock is an OS file lock, so it disappears with a crashed process;
+    the endpoint alone cannot serve as the lock because Windows allows
+    several instances of one named pipe.
+    """
+
+    def __init__(self, name: str, state_dir: str = DEFAULT_STATE_DIR):
+        self.name = name
+        self.state_dir = state_dir
+        self.lock_path = os.path.join(state_dir, f"{name}.lock")
+        self._lock_file = None
+        self._server: Optional[DaemonServer] = None
+
+    def acquire(self) -> bool:
+        """Take the lock without blocking; False means another instance holds it."""
+        self._lock_file = try_lock(self.lock_path)
+        return self._lock_file is not None
+
+    def serve(self, handlers: Dict[str, Handler]):
+        """Accept hand-off requests from later launches; only call after acquire() succeeded."""
+        self._server = DaemonServer(handlers, self.state_dir, endpoint=self.name)
+        self._server.start()
+
+    def hand_off(self, cmd: str, timeout: float = HANDOFF_WAIT) -> bool:
+        """Send cmd to the running instance, waiting briefly if it is still starting up."""
+        deadline = time.monotonic() + timeout
+        while True:
+            client = DaemonClient.connect(self.state_dir, endpoint=self.name)
+            if client:
+                try:
+                    return bool(client.request(cmd).get("ok"))
+                except (EOFError, OSError) as e:
+                    logger.warning(f"Hand-off to running instance failed: {e}")
+                    return False
+                finally:
+                    client.close()
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(HANDOFF_RETRY)
+
+    def release(self):
+        if self._server:
+            self._server.close()
+            self._server = None
+        if self._lock_file:
+            self._lock_file.close()
+            self._lock_file = None
@@ -1,22 +1,69 @@
-from bs4 import BeautifulSoup
+import sys
+
+if __name__ == "__main__" and "--daemon" in sys.argv[1:]:
+    # Autostart runs the headless monitor through this entry point, so frozen builds need no second executable
+    import monitor_daemon
+    monitor_daemon.main([arg for arg in sys.argv[1:] if arg != "--daemon"])
+    sys.exit(0)
+
+if __name__ == "__main__":
+    # A second launch hands over to the running instance before loading the UI stack
+    from single_instance import SingleInstance
+    INSTANCE = SingleInstance("savemycell-ui")
+    if not INSTANCE.acquire():
+        if INSTANCE.hand_off("restore"):
+            sys.exit(0)
+        # The running instance may have quit while we waited for it; if so, take over its lock
+        if not INSTANCE.acquire():
+            import logging
+            import os
+            handoff_log_dir = os.path.join(os.path.expanduser("~"), "AppData", "Local", "SaveMyCell")
+            os.makedirs(handoff_log_dir, exist_ok=True)
+            logging.basicConfig(filename=os.path.join(handoff_log_dir, "SaveMyCell.log"), level=logging.DEBUG,
+                                format='%(asctime)s - %(levelname)s - %(message)s')
+            logging.getLogger(__name__).error("Another instance holds the lock but did not answer the restore request.")
+            try:
+                import tkinter as tk
+                from tkinter import messagebox
+                root = tk.Tk()
+                root.withdraw()
+                messagebox.showerror("Save My Cell", "Save My Cell is already running but is not responding.\n"
+                                                     "Exit it from the tray or Task Manager and start it again.")
+                root.destroy()
+            except Exception as e:
+                logging.getLogger(__name__).error(f"Failed to show the already-running message: {e}")
+            sys.exit(1)
+
 import psutil
 import platform
 import getpass
 import socket
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox
 import tkinter as tk
-from PIL import Image, ImageTk
+from PIL import Image
 import threading
 import time
-import queue
 import logging
 import os
 import winreg
 import pystray
 import darkdetect
 import json
-import sys
+import gc
+from battery_snapshot import BatterySampler, BatterySnapshot
+from power_events import event_driven_interval, open_power_event_source, wait_for_power_event
+from sampling_scheduler import ThresholdScheduler
+from timer_wheel import TkTimerWheel
+from prompt_signal import PromptSignal
+from charge_estimator import shared_estimator
+from battery_report import parse_battery_report
+from diagnostics_collector import DiagnosticsCollector
+from home_view import HomeViewModel, LabelBinding
+from tween import Animator
+from lazy_import import LazyModule, LazyObject
+from daemon_ipc import DaemonClient
+from single_instance import MONITOR_INSTANCE, SingleInstance
 try:
     import win32api
     import win32con
@@ -24,9 +71,19 @@ except ImportError:
     win32api = None
     win32con = None
 
+# Rarely used modules are imported on first use to keep autostart fast
+filedialog = LazyModule("tkinter.filedialog")
+webbrowser = LazyModule("webbrowser")
+wmi = LazyModule("wmi")
+
 # Define version flag
 VERSION = "FREE"  # Can be "FREE" or "PRO"
 
+# Set by benchmarks/bench_startup.py to report time to first paint and exit
+STARTUP_PROBE_ENV = "SAVEMYCELL_STARTUP_PROBE"
+# Set by benchmarks/bench_lean_tray.py to report RSS around release_ui/rebuild_ui and exit
+LEAN_TRAY_PROBE_ENV = "SAVEMYCELL_LEAN_TRAY_PROBE"
+
 # Configure logging
 log_dir = os.path.join(os.path.expanduser("~"), "AppData", "Local", "SaveMyCell")
 if not os.path.exists(log_dir):
@@ -40,13 +97,48 @@ logger = logging.getLogger(__name__)
 RUNNING = True
 MINIMIZED_TO_TRAY = False
 UNPLUG_PROMPT_ACTIVE = False
-PROMPT_QUEUE = queue.Queue()
+PROMPT_SIGNAL = PromptSignal()
 WINDOW_WIDTH, WINDOW_HEIGHT = 800, 600
 UNPLUG_THRESHOLD = 90
 REFRESH_INTERVAL = 120
 POWER_SAVING_REFRESH_INTERVAL = 600
 IDLE_TIMEOUT = 120
 PROMPT_TIMEOUT = 30
+BATTERY_SNAPSHOT_MAX_AGE = 2
+DIAGNOSTICS_REFRESHING_MARKER = " (refreshing…)"
+DISCHARGE_RATE_WINDOW = 600
+POWER_EVENT_FALLBACK_INTERVAL = 600
+UNPLUG_PROMPT_COOLDOWN = 300
+DAEMON_CONNECT_WAIT = 5
+LEAN_TRAY = True  # destroy the widget tree while minimized and rebuild it on restore
+
+def create_battery_sampler():
+    from sysfs_battery import open_sysfs_battery_reader
+    return BatterySampler(max_age=BATTERY_SNAPSHOT_MAX_AGE, reader=open_sysfs_battery_reader())
+
+# Shared singletons are built on first use, so a viewer window or a quick
+# hand-off to the running instance never pays for the ones it does not touch.
+
+# Single owner of the hardware battery read; every consumer reads its snapshot
+battery_sampler = LazyObject(create_battery_sampler)
+# In-memory record of every sample the monitor takes, persisted to an mmap'ed log
+battery_history = LazyObject("battery_history:BatteryHistory")
+# Opened on the monitor thread only while the app owns monitoring; the daemon writes it otherwise
+history_log = None
+
+# Rolling CPU/memory/disk usage for diagnostics; started once the window is up
+system_sampler = LazyObject("system_sampler:SystemSampler")
+network_status = LazyObject("network_status:NetworkStatusProvider")
+process_energy = LazyObject("energy_attribution:ProcessEnergyCollector", discharge_rate=lambda: get_discharge_rate())
+
+# powercfg battery report, regenerated in the background and cached by content
+report_job = LazyObject("report_pipeline:BatteryReportJob", os.path.join(log_dir, "battery_report.html"))
+
+# Scaled logo and tray icon images, persisted so restarts skip the resampling
+image_cache = LazyObject("image_cache:ImageCache", os.path.join(log_dir, "image_cache"))
+
+# Live charge level in the tray icon, composited from per-theme glyph atlases
+tray_renderer = LazyObject("tray_icon:TrayIconRenderer")
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("light")
@@ -54,17 +146,15 @@ ctk.set_default_color_theme("blue")
 
 # Utility Functions
 def generate_battery_report():
-    import os
-    import webbrowser
-
-    os.system('powercfg /batteryreport /output battery_report.html')
-    webbrowser.open('battery_report.html')
+    def open_report(ok):
+        if ok:
+            webbrowser.open(report_job.report_path)
 
-    return "Generated battery report."
+    if not report_job.refresh(on_done=open_report):
+        return "Battery report generation already in progress."
+    return "Generating battery report."
 
 def get_metrics_from_wmi():
-    import wmi
-
     c = wmi.WMI(namespace="root\\WMI")
 
     voltage = "N/A"
@@ -94,48 +184,10 @@ def get_metrics_from_wmi():
     }
 
 def get_metrics_from_battery_report():
-    print("got here")
-    if not os.path.exists("battery_report.html"):
-        try:
-            generate_battery_report()
-        except Exception as e:
-            return {
-                "design_capacity": None,
-                "full_charge_capacity": None,
-                "cycle_count": None
-            }
-
-    return extract_battery_details("battery_report.html")
+    return report_job.metrics()
 
 def extract_battery_details(report_path="battery_report.html"):
-    details = {
-        "design_capacity": None,
-        "full_charge_capacity": None,
-        "cycle_count": None
-    }
-
-    with open(report_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "lxml")
-
-    # Look for Installed batteries section
-    installed_section = soup.find_all("table")[1]
-
-    if installed_section:
-        rows = installed_section.find_all("tr")
-
-        for row in rows:
-            print(f"{row}\n")
-            cells = [c.get_text(strip=True) for c in row.find_all(["td", "th"])]
-            if len(cells) == 2:
-                key, value = cells
-                if "Design Capacity".upper() in key:
-                    details["design_capacity"] = value
-                elif "Full Charge Capacity".upper() in key:
-                    details["full_charge_capacity"] = value
-                elif "Cycle Count".upper() in key:
-                    details["cycle_count"] = value
-
-    return details
+    return parse_battery_report(report_path)
 
 def calculate_battery_time(battery):
     if not battery:
@@ -149,9 +201,7 @@ def calculate_battery_time(battery):
     if battery.power_plugged:
         current_percent = battery.percent
         remaining_percent = 100 - current_percent
-        charging_rate = 40.0 + (60.0 - 40.0) * (1 - current_percent / 100)
-        hours_to_full = remaining_percent / charging_rate
-        total_seconds = int(hours_to_full * 3600)
+        total_seconds = int(shared_estimator().seconds_to_full(current_percent))
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
         return f"Time to Full Charge: {hours}h {minutes}m" if remaining_percent > 0 else "Time to Full Charge: Fully Charged"
@@ -164,7 +214,7 @@ def get_system_details():
         "Operating System": f"{platform.system()} {platform.release()}",
         "Processor": platform.processor()
     }
-    battery = psutil.sensors_battery()
+    battery = battery_sampler.get()
     if battery:
         details.update({
             "Battery Percentage": f"{battery.percent}%",
@@ -185,21 +235,9 @@ def get_system_details():
         })
     return details
 
-def get_diagnostic_sections():
-    mem = psutil.virtual_memory()
-    memory_usage = f"{mem.used / 1e9:.1f} GB / {mem.total / 1e9:.1f} GB"
-    disk = psutil.disk_usage('/')
-    storage_usage = f"Storage Usage: {disk.used / 1e9:.1f} GB / {disk.total / 1e9:.1f} GB"
-    network_status = "Connected" if socket.gethostbyname(socket.gethostname()) else "Disconnected"
-    battery = psutil.sensors_battery()
-    battery_summary = [
-        str(battery.percent) if battery else "N/A",
-        "Status: Charging" if battery and battery.power_plugged else "Status: Discharging",
-        f"Power Plugged: {battery.power_plugged}" if battery else "Power Plugged: N/A",
-        f"Time to Full Charge: {calculate_battery_time(battery)}" if battery and battery.power_plugged else "Time to Full Charge: N/A",
-        f"Time to Complete Discharge: {calculate_battery_time(battery)}" if battery and not battery.power_plugged else "Time to Complete Discharge: N/A"
-    ]
-    percent = battery_summary.pop(0)
+def get_battery_health_section():
+    battery = battery_sampler.get()
+    percent = str(battery.percent) if battery else "N/A"
 
     details_from_battery_report = get_metrics_from_battery_report()
 
@@ -214,72 +252,131 @@ def get_diagnostic_sections():
         print(e)
         capacity_retention = "Unknown"
 
-    sections = [
-        ("Battery Health", [
-            f"Current Capacity: {percent}%",
-            f"Design Capacity: {design_capacity}",
-            f"Full Charge Capacity: {full_charge_capacity}",
-            f"Capacity Retention: {capacity_retention}",
-        ]),
-        ("Charging System", battery_summary),
-        ("System Performance", [
-            f"Memory Usage: {memory_usage}",
-            f"Storage Usage: {storage_usage}",
-            f"CPU Usage: {psutil.cpu_percent()}%"
-        ])
+    return [
+        f"Current Capacity: {percent}%",
+        f"Design Capacity: {design_capacity}",
+        f"Full Charge Capacity: {full_charge_capacity}",
+        f"Capacity Retention: {capacity_retention}",
+    ]
+
+def get_charging_system_section():
+    battery = battery_sampler.get()
+    return [
+        "Status: Charging" if battery and battery.power_plugged else "Status: Discharging",
+        f"Power Plugged: {battery.power_plugged}" if battery else "Power Plugged: N/A",
+        f"Time to Full Charge: {calculate_battery_time(battery)}" if battery and battery.power_plugged else "Time to Full Charge: N/A",
+        f"Time to Complete Discharge: {calculate_battery_time(battery)}" if battery and not battery.power_plugged else "Time to Complete Discharge: N/A"
+    ]
+
+def format_window_stats(stats):
+    return f"{stats.current:.1f}% (min {stats.minimum:.1f}%, avg {stats.average:.1f}%, max {stats.maximum:.1f}%)"
+
+def get_system_performance_section():
+    latest = system_sampler.latest
+    if latest is None:
+        return ["Measuring system usage..."]
+    stats = system_sampler.stats()
+    memory_usage = f"{latest.memory_used / 1e9:.1f} GB / {latest.memory_total / 1e9:.1f} GB"
+    storage_usage = f"Storage Usage: {latest.disk_used / 1e9:.1f} GB / {latest.disk_total / 1e9:.1f} GB"
+    return [
+        f"Memory Usage: {memory_usage} (avg {stats['memory'].average:.1f}%, max {stats['memory'].maximum:.1f}%)",
+        f"Storage Usage: {storage_usage}",
+        f"CPU Usage: {format_window_stats(stats['cpu'])}",
+        f"Network Status: {network_status.describe()}"
     ]
-    return sections
+
+def get_discharge_rate():
+    """Current discharge rate in percent per hour, or None while plugged in."""
+    battery = battery_sampler.latest
+    if not battery or battery.power_plugged:
+        return None
+    if battery.secsleft > 0:
+        return battery.percent * 3600 / battery.secsleft
+    views = battery_history.since(time.time() - DISCHARGE_RATE_WINDOW)
+    if not views or any(any(view.plugged) for view in views):
+        return None
+    elapsed = views[-1].timestamps[-1] - views[0].timestamps[0]
+    drop = views[0].percents[0] - views[-1].percents[-1]
+    return drop * 3600 / elapsed if elapsed > 0 and drop > 0 else None
+
+def get_power_consumption_section():
+    report = process_energy.report
+    if report is None:
+        return ["Measuring process activity..."]
+    if report.discharge_rate is None:
+        items = ["Discharge Rate: N/A (on AC power)"]
+    else:
+        items = [f"Discharge Rate: {report.discharge_rate:.1f}%/h"]
+    for entry in report.top:
+        usage = f"{entry.share * 100:.0f}% of CPU time"
+        if entry.percent_per_hour is not None:
+            usage += f", ~{entry.percent_per_hour:.1f}%/h"
+        items.append(f"{entry.name} (PID {entry.pid}): {usage}")
+    return items
+
+DIAGNOSTIC_SECTIONS = [
+    ("Battery Health", get_battery_health_section),
+    ("Charging System", get_charging_system_section),
+    ("System Performance", get_system_performance_section),
+    ("Power Consumption", get_power_consumption_section),
+]
+
+def get_diagnostic_sections():
+    return [(title, collect()) for title, collect in DIAGNOSTIC_SECTIONS]
+
+AUTO_START_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+AUTO_START_APP_NAME = "SaveMyCellbyValionTech"
+
+def auto_start_command():
+    """Command line that starts the monitoring daemon at login, or None if it cannot be built."""
+    if getattr(sys, 'frozen', False):
+        executable_path = sys.executable
+        if not os.path.exists(executable_path):
+            logger.error(f"Executable path does not exist: {executable_path}")
+            return None
+        if os.path.dirname(executable_path).lower() == os.path.join(os.environ.get("ProgramFiles", "").lower(), "SaveMyCell").lower():
+            installed_path = os.path.join(os.environ.get("ProgramFiles", ""), "SaveMyCell", "SaveMyCell.exe")
+            if os.path.exists(installed_path):
+                executable_path = installed_path
+        return f'"{executable_path}" --daemon'
+    python_exe = sys.executable.replace("python.exe", "pythonw.exe")  # Use pythonw.exe for windowless execution
+    script_path = os.path.abspath(__file__)
+    if not os.path.exists(python_exe) or not os.path.exists(script_path):
+        logger.error(f"Python or script path not found: {python_exe}, {script_path}")
+        return None
+    return f'"{python_exe}" "{script_path}" --daemon'
 
 def set_auto_start(enabled: bool) -> bool:
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                             r"Software\Microsoft\Windows\CurrentVersion\Run", 0, winreg.KEY_ALL_ACCESS)
-        app_name = "SaveMyCellbyValionTech"
+        registry_value = auto_start_command() if enabled else None
+        if enabled and registry_value is None:
+            return False
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTO_START_KEY, 0, winreg.KEY_ALL_ACCESS)
         if enabled:
-            if getattr(sys, 'frozen', False):
-                executable_path = sys.executable
-                if not os.path.exists(executable_path):
-                    logger.error(f"Executable path does not exist: {executable_path}")
-                    winreg.CloseKey(key)
-                    return False
-                if os.path.dirname(executable_path).lower() == os.path.join(os.environ.get("ProgramFiles", "").lower(), "SaveMyCell").lower():
-                    installed_path = os.path.join(os.environ.get("ProgramFiles", ""), "SaveMyCell", "SaveMyCell.exe")
-                    if os.path.exists(installed_path):
-                        executable_path = installed_path
-                registry_value = f'"{executable_path}"'
-            else:
-                python_exe = sys.executable.replace("python.exe", "pythonw.exe")  # Use pythonw.exe for windowless execution
-                script_path = os.path.abspath(__file__)
-                if not os.path.exists(python_exe) or not os.path.exists(script_path):
-                    logger.error(f"Python or script path not found: {python_exe}, {script_path}")
-                    winreg.CloseKey(key)
-                    return False
-                registry_value = f'"{python_exe}" "{script_path}"'
             logger.info(f"Setting auto-start with value: {registry_value}")
-            winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, registry_value)
+            winreg.SetValueEx(key, AUTO_START_APP_NAME, 0, winreg.REG_SZ, registry_value)
         else:
-            winreg.DeleteValue(key, app_name)
+            winreg.DeleteValue(key, AUTO_START_APP_NAME)
         winreg.CloseKey(key)
         return True
     except Exception as e:
         logger.error(f"Failed to set auto-start: {str(e)}")
         return False
 
-def is_auto_start_enabled() -> bool:
+def get_auto_start_command():
+    """The command line currently registered to run at login, or None."""
     try:
-        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                             r"Software\Microsoft\Windows\CurrentVersion\Run", 0, winreg.KEY_READ)
-        app_name = "SaveMyCellbyValionTech"
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, AUTO_START_KEY, 0, winreg.KEY_READ)
         try:
-            winreg.QueryValueEx(key, app_name)
-            winreg.CloseKey(key)
-            return True
+            value, _ = winreg.QueryValueEx(key, AUTO_START_APP_NAME)
+            return value
         except FileNotFoundError:
+            return None
+        finally:
             winreg.CloseKey(key)
-            return False
     except Exception as e:
         logger.error(f"Failed to check auto-start: {e}")
-        return False
+        return None
 
 def get_idle_time() -> float:
     if win32api is None or win32con is None:
@@ -296,8 +393,10 @@ def get_idle_time() -> float:
 
 # Monitoring Logic
 class BatteryMonitor:
-    def __init__(self, app):
+    def __init__(self, app, events=None):
         self.app = app
+        self.events = events
+        self.scheduler = ThresholdScheduler(max_interval=POWER_SAVING_REFRESH_INTERVAL)
         self.last_battery = None
         self.last_unplug_prompt_time = 0
         self.last_update = 0
@@ -307,15 +406,27 @@ class BatteryMonitor:
 
     def run(self):
         global RUNNING, UNPLUG_PROMPT_ACTIVE, MINIMIZED_TO_TRAY
+        open_history_log()
+        self.restore_history()
         while RUNNING:
             try:
-                battery = psutil.sensors_battery()
+                battery = battery_sampler.sample()
                 if not battery:
                     logger.warning("Battery status unavailable.")
                     time.sleep(10)
                     continue
                 with self.lock:
                     current_time = time.time()
+                    battery_history.append(battery.timestamp, battery.percent,
+                                           battery.power_plugged, battery.secsleft)
+                    if history_log:
+                        history_log.append(battery.timestamp, battery.percent,
+                                           battery.power_plugged, battery.secsleft)
+                    estimator = shared_estimator()
+                    estimator.observe(battery.timestamp, battery.percent, battery.power_plugged)
+                    if estimator.dirty and not battery.power_plugged:
+                        estimator.save()
+                    self.scheduler.observe(battery.timestamp, battery.percent, battery.power_plugged)
                     if MINIMIZED_TO_TRAY and (not battery.power_plugged or battery.percent < self.app.unplug_threshold):
                         sleep_interval = 300
                     elif self.app.power_saving_mode:
@@ -324,36 +435,80 @@ class BatteryMonitor:
                         sleep_interval = 5
                     else:
                         sleep_interval = self.app.refresh_interval
+                    sleep_interval = self.scheduler.next_interval(battery.percent, battery.power_plugged,
+                                                                  self.app.unplug_threshold, sleep_interval)
+                    if self.events:
+                        sleep_interval = self.event_driven_interval(battery, sleep_interval, current_time)
                     if battery.percent >= self.app.unplug_threshold and battery.power_plugged:
                         if not UNPLUG_PROMPT_ACTIVE:
                             if self.last_battery and not self.last_battery.power_plugged and battery.power_plugged:
                                 logger.info("Charger replugged above threshold, triggering prompt...")
-                                PROMPT_QUEUE.put(True)
-                            elif current_time - self.last_unplug_prompt_time >= 300 or not self.last_unplug_prompt_time:
+                                PROMPT_SIGNAL.post()
+                            elif current_time - self.last_unplug_prompt_time >= UNPLUG_PROMPT_COOLDOWN or not self.last_unplug_prompt_time:
                                 logger.info("Triggering unplug prompt...")
-                                PROMPT_QUEUE.put(True)
+                                PROMPT_SIGNAL.post()
                                 self.last_unplug_prompt_time = current_time
                     elif self.last_battery and not battery.power_plugged and self.last_battery.power_plugged:
                         if battery.percent < self.app.unplug_threshold:
                             self.last_unplug_prompt_time = 0
                             logger.info("Charger unplugged and below threshold, resetting cooldown.")
                     self.last_battery = battery
+                    self.app.update_tray_icon(battery)
                     if self.app.root.winfo_exists() and not MINIMIZED_TO_TRAY:
                         if self.last_percent is None or self.last_plugged is None or \
                            abs(battery.percent - self.last_percent) >= 1 or battery.power_plugged != self.last_plugged:
-                            self.app.root.after(0, lambda: self.app.update_battery_ui(
-                                battery.percent, battery.power_plugged))
+                            self.app.root.after(0, lambda battery=battery: self.app.update_battery_ui(battery))
                             self.last_percent = battery.percent
                             self.last_plugged = battery.power_plugged
                     if current_time - self.last_update >= 300:
                         self.app.update_system_stats()
                         self.last_update = current_time
-                time.sleep(sleep_interval)
+                self.wait(sleep_interval)
             except Exception as e:
                 logger.error(f"Monitor error: {e}")
                 time.sleep(10)
 
+    def restore_history(self):
+        if not history_log:
+            return
+        try:
+            # One pass fills the ring buffer and feeds the estimator the samples it has not learned yet
+            estimator = shared_estimator()
+            since = time.time() - battery_history.capacity * 5
+            for record in history_log.records(since=min(since, estimator.learned_until)):
+                timestamp, percent, plugged, _ = record
+                estimator.observe(timestamp, percent, plugged)
+                if timestamp >= since:
+                    battery_history.append(*record)
+            estimator.end_session()
+            if estimator.dirty:
+                estimator.save()
+            logger.info(f"Restored {len(battery_history)} samples from the history log.")
+        except Exception as e:
+            logger.error(f"Failed to restore battery history: {e}")
+
+    def event_driven_interval(self, battery, sleep_interval, current_time):
+        # Plug and unplug wake us immediately, so polling only has to cover
+        # what uevents cannot: the prompt cooldown and charging progress.
+        since_prompt = current_time - self.last_unplug_prompt_time if self.last_unplug_prompt_time else None
+        return event_driven_interval(sleep_interval, battery.power_plugged,
+                                     battery.percent >= self.app.unplug_threshold, since_prompt,
+                                     POWER_EVENT_FALLBACK_INTERVAL, UNPLUG_PROMPT_COOLDOWN)
+
+    def wait(self, timeout):
+        return wait_for_power_event(self.events, timeout)
+
 # System Tray
+def open_history_log():
+    global history_log
+    from history_log import HistoryLog, HistoryLogBusy
+    try:
+        history_log = HistoryLog(os.path.join(log_dir, "history"))
+    except HistoryLogBusy as e:
+        logger.warning(f"{e}; samples are not recorded by this process.")
+    except Exception as e:
+        logger.error(f"Failed to open history log: {e}")
+
 def create_tray_icon(app):
     global MINIMIZED_TO_TRAY
     if getattr(sys, 'frozen', False):
@@ -363,8 +518,7 @@ def create_tray_icon(app):
     icon_path = os.path.join(base_path, "icon.png")
     try:
         if os.path.exists(icon_path) and os.path.getsize(icon_path) > 0:
-            icon = Image.open(icon_path)
-            icon = icon.resize((32, 32), Image.Resampling.LANCZOS)
+            icon = image_cache.image(icon_path, (32, 32))
             logger.info(f"Loaded tray icon from {icon_path}")
         else:
             logger.warning(f"Icon file {icon_path} not found or empty. Using fallback.")
@@ -396,6 +550,17 @@ def quit_app(app):
     logger.info("Quitting app...")
     RUNNING = False
     MINIMIZED_TO_TRAY = False
+    if app.monitor.events:
+        app.monitor.events.close()
+    if history_log:
+        history_log.flush()
+    if system_sampler.loaded:
+        system_sampler.stop()
+    if process_energy.loaded:
+        process_energy.stop()
+    if app.daemon:
+        app.daemon.close()
+    app.monitor_instance.release()
     if app.tray:
         app.tray.stop()
     if app.root:
@@ -422,10 +587,37 @@ class BatteryMonitorApp:
         self.appearance_mode = "light" if not self.is_dark_mode else "dark"
         self.current_page = "home"
         self.battery_percentage = 100
+        self.diagnostics = DiagnosticsCollector(DIAGNOSTIC_SECTIONS)
+        self.diagnostic_widgets = {}
+        self.pages = {}
+        self.visible_page = None
+        # Time to full comes from the learned charge profile, so its updates invalidate the cached text
+        self.home_view_model = HomeViewModel(calculate_battery_time,
+                                             generation=lambda: shared_estimator().generation)
+        self.home_labels = LabelBinding()
+        self.home_view = None
+        self.ui_released = False
+        self.lean_tray_rss = None
+
+        # Exactly one process samples and prompts. Without the monitor lock a
+        # monitor_daemon.py holds it and this window is only a viewer.
+        self.monitor_instance = SingleInstance(MONITOR_INSTANCE, log_dir)
+        self.owns_monitor = self.monitor_instance.acquire()
+        self.daemon = None
+        if not self.owns_monitor:
+            self.daemon = DaemonClient.connect(log_dir, timeout=DAEMON_CONNECT_WAIT)
+            if not self.daemon:
+                logger.warning("Monitoring is owned by another process that does not answer; the display is not live.")
 
         # System tray
-        self.tray, self.tray_thread = create_tray_icon(self)
-        self.tray_thread.start()
+        if self.owns_monitor:
+            self.tray, self.tray_thread = create_tray_icon(self)
+        else:
+            self.tray, self.tray_thread = None, None
+        self.tray_icon_key = None
+        if self.tray_thread:
+            # The tray shows icon.png until the monitor's first sample draws the charge level off the UI thread
+            self.tray_thread.start()
 
         # Load settings
         self.load_settings_from_file()
@@ -437,12 +629,38 @@ class BatteryMonitorApp:
         # Setup UI
         self.setup_main_layout()
 
-        # Start monitoring
-        self.monitor = BatteryMonitor(self)
-        self.monitor_thread = threading.Thread(target=self.monitor.run, daemon=True)
-        self.monitor_thread.start()
-        self.root.after(1000, self.check_theme_change)
-        self.root.after(500, self.check_prompt_queue)
+        # Start monitoring; the diagnostics samplers are imported and built off the UI thread
+        threading.Thread(target=self.start_samplers, name="samplers", daemon=True).start()
+        PROMPT_SIGNAL.attach(self.root, self.handle_prompt_request)
+        if self.owns_monitor:
+            self.monitor = BatteryMonitor(self, events=open_power_event_source())
+            self.monitor_thread = threading.Thread(target=self.monitor.run, daemon=True)
+        else:
+            self.monitor = BatteryMonitor(self)
+            self.monitor_thread = threading.Thread(target=self.follow_daemon, daemon=True)
+        if self.owns_monitor or self.daemon:
+            self.monitor_thread.start()
+
+        # Periodic UI work shares one coalescing timer; theme checks pause in the tray
+        self.timers = TkTimerWheel(self.root)
+        self.animator = Animator(self.root)
+        self.timers.register("theme", self.check_theme_change, 1000)
+        self.schedule_battery_refresh()
+
+    def schedule_battery_refresh(self):
+        # The monitor (or daemon) may sleep until the predicted threshold crossing,
+        # up to POWER_SAVING_REFRESH_INTERVAL, so the visible window refreshes on its own
+        self.timers.register("battery", self.refresh_battery_display, self.refresh_interval * 1000)
+
+    def refresh_battery_display(self):
+        battery = battery_sampler.get()
+        self.update_tray_icon(battery)
+        self.update_battery_ui(battery)
+
+    def start_samplers(self):
+        system_sampler.start()
+        network_status.refresh()
+        process_energy.start()
 
     def setup_main_layout(self):
         self.left_frame = ctk.CTkFrame(self.main_container, width=250, corner_radius=10)
@@ -469,9 +687,7 @@ class BatteryMonitorApp:
 
         if self.custom_logo_path and os.path.exists(self.custom_logo_path):
             try:
-                logo_img = Image.open(self.custom_logo_path)
-                logo_img = logo_img.resize((80, 80), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
+                logo_photo = image_cache.photo(self.custom_logo_path, (80, 80))
                 user_icon_label.configure(image=logo_photo, text="")
                 user_icon_label.image = logo_photo
                 logger.info(f"Custom logo loaded in left panel from {self.custom_logo_path}")
@@ -503,7 +719,7 @@ class BatteryMonitorApp:
                                           command=self.show_settings_page)
         self.settings_btn.pack(anchor="w", pady=5)
 
-        self.stop_button = ctk.CTkButton(nav_frame, text="Minimize to Tray",
+        self.stop_button = ctk.CTkButton(nav_frame, text="Minimize to Tray" if self.owns_monitor else "Close",
                                          command=self.minimize_to_tray,
                                          height=40, font=ctk.CTkFont(size=14),
                                          fg_color="#D83B01", hover_color="#A12D00")
@@ -512,16 +728,35 @@ class BatteryMonitorApp:
     def clear_right_frame(self):
         for widget in self.right_frame.winfo_children():
             widget.destroy()
+        self.pages = {}
+        self.visible_page = None
+
+    def show_page(self, name):
+        """Show a page, building it on first use and refreshing only its data afterwards."""
+        page = self.pages.get(name)
+        if page is None or not page.winfo_exists():
+            page = ctk.CTkFrame(self.right_frame, fg_color="transparent")
+            getattr(self, f"build_{name}_page")(page)
+            self.pages[name] = page
+        if self.visible_page is not page:
+            if self.visible_page is not None and self.visible_page.winfo_exists():
+                self.visible_page.pack_forget()
+            page.pack(fill="both", expand=True)
+            self.visible_page = page
+        self.current_page = name
+        refresh = getattr(self, f"refresh_{name}_page", None)
+        if refresh:
+            refresh()
 
     def clear_left_frame(self):
         for widget in self.left_frame.winfo_children():
             widget.destroy()
 
     def show_home_page(self):
-        self.current_page = "home"
-        self.clear_right_frame()
+        self.show_page("home")
 
-        home_content = ctk.CTkFrame(self.right_frame, fg_color="transparent")
+    def build_home_page(self, page):
+        home_content = ctk.CTkFrame(page, fg_color="transparent")
         home_content.pack(fill="both", expand=True, padx=20, pady=20)
 
         battery_frame = ctk.CTkFrame(home_content, fg_color="transparent", height=180, width=350)
@@ -541,24 +776,22 @@ class BatteryMonitorApp:
                                   font=ctk.CTkFont(size=18, weight="bold"))
         info_title.pack(pady=(10, 10))
 
-        battery = psutil.sensors_battery()
-        battery_summary = [
-            "Status: Charging" if battery and battery.power_plugged else "Status: Discharging",
-            f"Power Plugged: {battery.power_plugged}" if battery else "Power Plugged: N/A",
-            f"Time to Full Charge: {calculate_battery_time(battery)}" if battery and battery.power_plugged else "Time to Full Charge: N/A",
-            f"Time to Complete Discharge: {calculate_battery_time(battery)}" if battery and not battery.power_plugged else "Time to Complete Discharge: N/A"
-        ]
+        # Texts are filled in by update_battery_ui from the view-model
         self.battery_status_labels = []
-        for item in battery_summary:
-            if item:
-                detail_label = ctk.CTkLabel(info_frame, text=item, font=ctk.CTkFont(size=14))
-                detail_label.pack(pady=2)
-                self.battery_status_labels.append(detail_label)
+        for _ in self.home_view_model.view(None).status_lines:
+            detail_label = ctk.CTkLabel(info_frame, text="", font=ctk.CTkFont(size=14))
+            detail_label.pack(pady=2)
+            self.battery_status_labels.append(detail_label)
 
         ctk.CTkLabel(info_frame, text="").pack(pady=10)
+        self.home_labels.bind([battery_label] + self.battery_status_labels)
+        self.home_view = None
 
-    def create_header_with_back_button(self, title):
-        header_frame = ctk.CTkFrame(self.right_frame, fg_color="transparent")
+    def refresh_home_page(self):
+        self.update_battery_ui(battery_sampler.get())
+
+    def create_header_with_back_button(self, parent, title):
+        header_frame = ctk.CTkFrame(parent, fg_color="transparent")
         header_frame.pack(fill="x", padx=20, pady=(20, 10))
 
         back_btn = ctk.CTkButton(header_frame, text="←", command=self.show_home_page,
@@ -574,15 +807,18 @@ class BatteryMonitorApp:
         return header_frame
 
     def show_system_diagnostics(self):
-        self.current_page = "diagnostics"
-        self.clear_right_frame()
+        self.show_page("diagnostics")
 
-        self.create_header_with_back_button("System Diagnostics")
+    def build_diagnostics_page(self, page):
+        self.create_header_with_back_button(page, "System Diagnostics")
 
-        content_frame = ctk.CTkScrollableFrame(self.right_frame)
+        content_frame = ctk.CTkScrollableFrame(page)
         content_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
-        sections = get_diagnostic_sections()
+        # Render the last collected values straight away; refresh_diagnostics_page updates them
+        self.diagnostic_widgets = {}
+        sections = [(title, self.diagnostics.cached(title)) for title in self.diagnostics.titles]
+        sections.append(("Application", self.application_diagnostics()))
         for section_title, items in sections:
             section_frame = ctk.CTkFrame(content_frame)
             section_frame.pack(fill="x", padx=20, pady=10)
@@ -591,20 +827,56 @@ class BatteryMonitorApp:
                                        font=ctk.CTkFont(size=16, weight="bold"))
             title_label.pack(pady=(15, 10), anchor="w", padx=20)
 
-            for item in items:
-                item_label = ctk.CTkLabel(section_frame, text=f"• {item}",
+            texts = [f"• {item}" for item in items] if items is not None else ["• Loading..."]
+            item_labels = []
+            for text in texts:
+                item_label = ctk.CTkLabel(section_frame, text=text,
                                           font=ctk.CTkFont(size=12), anchor="w")
                 item_label.pack(pady=2, anchor="w", padx=40)
-
-            ctk.CTkLabel(section_frame, text="").pack(pady=5)
+                item_labels.append(item_label)
+
+            spacer = ctk.CTkLabel(section_frame, text="")
+            spacer.pack(pady=5)
+            self.diagnostic_widgets[section_title] = (section_frame, title_label, item_labels, texts, spacer)
+
+    def refresh_diagnostics_page(self):
+        for title in self.diagnostics.titles:
+            self.diagnostic_widgets[title][1].configure(text=f"{title}{DIAGNOSTICS_REFRESHING_MARKER}")
+        self.update_diagnostic_section("Application", self.application_diagnostics())
+        self.diagnostics.refresh(lambda title, items: self.root.after(
+            0, lambda: self.update_diagnostic_section(title, items)))
+
+    def update_diagnostic_section(self, title, items):
+        widgets = self.diagnostic_widgets.get(title)
+        if not widgets or not widgets[0].winfo_exists():
+            return
+        section_frame, title_label, item_labels, texts, spacer = widgets
+        title_label.configure(text=title)
+        if items is None:
+            return
+        new_texts = [f"• {item}" for item in items]
+        for i, text in enumerate(new_texts):
+            if i < len(item_labels):
+                if texts[i] != text:
+                    item_labels[i].configure(text=text)
+                    texts[i] = text
+            else:
+                item_label = ctk.CTkLabel(section_frame, text=text,
+                                          font=ctk.CTkFont(size=12), anchor="w")
+                item_label.pack(pady=2, anchor="w", padx=40, before=spacer)
+                item_labels.append(item_label)
+                texts.append(text)
+        while len(item_labels) > len(new_texts):
+            item_labels.pop().destroy()
+            texts.pop()
 
     def show_about_page(self):
-        self.current_page = "about"
-        self.clear_right_frame()
+        self.show_page("about")
 
-        self.create_header_with_back_button("About Save My Cell")
+    def build_about_page(self, page):
+        self.create_header_with_back_button(page, "About Save My Cell")
 
-        content_frame = ctk.CTkScrollableFrame(self.right_frame)
+        content_frame = ctk.CTkScrollableFrame(page)
         content_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
         version_text = "Pro Version" if VERSION == "PRO" else "Free Version"
@@ -636,12 +908,12 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
         text_label.pack(padx=20, pady=20, anchor="w")
 
     def show_settings_page(self):
-        self.current_page = "settings"
-        self.clear_right_frame()
+        self.show_page("settings")
 
-        self.create_header_with_back_button("Settings")
+    def build_settings_page(self, page):
+        self.create_header_with_back_button(page, "Settings")
 
-        content_frame = ctk.CTkScrollableFrame(self.right_frame)
+        content_frame = ctk.CTkScrollableFrame(page)
         content_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
         general_frame = ctk.CTkFrame(content_frame)
@@ -780,6 +1052,14 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
                                   font=ctk.CTkFont(size=14))
         apply_btn.pack(anchor="e")
 
+    def refresh_settings_page(self):
+        # Discard unapplied edits from the last visit
+        self.threshold_var.set(self.unplug_threshold)
+        self.refresh_var.set(self.refresh_interval)
+        self.power_saving_var.set(self.power_saving_mode)
+        self.logo_var.set(self.custom_logo_path)
+        self.theme_var.set(self.appearance_mode)
+
     def change_appearance_mode(self, mode):
         self.appearance_mode = mode
         ctk.set_appearance_mode(mode)
@@ -824,8 +1104,10 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
             logger.error(f"Unexpected error loading settings from {settings_file}: {e}")
             messagebox.showerror("Error", f"Failed to load settings. Using defaults. Details: {e}")
             self.save_settings_to_file()
-        if not is_auto_start_enabled():
-            logger.info("Auto-start not enabled, enabling it now...")
+        # Installs from before the monitoring daemon registered the UI itself; rewrite any command that differs
+        expected = auto_start_command()
+        if expected and get_auto_start_command() != expected:
+            logger.info("Auto-start missing or outdated, registering the monitoring daemon...")
             set_auto_start(True)
 
     def save_settings_to_file(self):
@@ -860,6 +1142,7 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
                     messagebox.showerror("Error", "Refresh interval must be greater than 0.")
                     return
                 self.refresh_interval = refresh_interval
+                self.schedule_battery_refresh()
             self.unplug_threshold = unplug_threshold
             self.power_saving_mode = self.power_saving_var.get()
             self.custom_logo_path = self.logo_var.get().strip()
@@ -896,20 +1179,51 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
                                command=confirmation_window.destroy)
         ok_btn.pack(pady=(0, 20))
 
-    def update_battery_ui(self, percent, plugged):
-        self.battery_percentage = percent
-        if self.current_page == "home" and hasattr(self, 'battery_label'):
-            self.battery_label.configure(text=f"{percent:.0f}%")
-            battery = psutil.sensors_battery()
-            battery_summary = [
-                "Status: Charging" if battery and battery.power_plugged else "Status: Discharging",
-                f"Power Plugged: {battery.power_plugged}" if battery else "Power Plugged: N/A",
-                f"Time to Full Charge: {calculate_battery_time(battery)}" if battery and battery.power_plugged else "Time to Full Charge: N/A",
-                f"Time to Complete Discharge: {calculate_battery_time(battery)}" if battery and not battery.power_plugged else "Time to Complete Discharge: N/A"
-            ]
-            for i, label in enumerate(self.battery_status_labels):
-                if i < len(battery_summary) and battery_summary[i]:
-                    label.configure(text=battery_summary[i])
+    def update_battery_ui(self, battery):
+        if battery:
+            self.battery_percentage = battery.percent
+        view = self.home_view_model.view(battery)
+        # The view-model hands back the same object for an unchanged reading
+        if self.current_page != "home" or view is self.home_view:
+            return
+        self.home_view = view
+        self.home_labels.render((view.percent_text,) + view.status_lines)
+
+    def handle_restore_request(self, request):
+        # Called on an IPC thread when the app is launched again
+        logger.info("Another launch asked this instance to show itself.")
+        self.root.after(0, self.bring_to_front)
+        return {"ok": True}
+
+    def bring_to_front(self):
+        if MINIMIZED_TO_TRAY:
+            self.show_main_screen()
+        else:
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
+
+    def follow_daemon(self):
+        for message in self.daemon.subscribe():
+            if message.get("event") == "battery" and RUNNING:
+                battery = BatterySnapshot(**message["battery"])
+                self.root.after(0, lambda battery=battery: self.update_battery_ui(battery))
+        if RUNNING:
+            logger.warning("Monitoring daemon went away; the battery display is no longer live.")
+
+    def update_tray_icon(self, battery):
+        """Show the charge level in the tray; only redraws when the percent, charging state or theme changes."""
+        if not self.tray or not battery:
+            return
+        key = tray_renderer.frame_key(battery, self.is_dark_mode)
+        if key == self.tray_icon_key:
+            return
+        self.tray_icon_key = key
+        try:
+            self.tray.icon = tray_renderer.frame(*key)
+            self.tray.title = f"Save My Cell - {key[0]}%{' (charging)' if key[1] else ''}"
+        except Exception as e:
+            logger.error(f"Failed to update tray icon: {e}")
 
     def update_system_stats(self):
         pass
@@ -935,11 +1249,7 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
         self.unplug_window.geometry(f"+{x}+{y}")
 
         if not self.power_saving_mode:
-            self.unplug_window.attributes('-alpha', 0)
-            for alpha in range(0, 21):
-                self.unplug_window.attributes('-alpha', alpha / 20)
-                time.sleep(0.01)
-            self.unplug_window.attributes('-alpha', 0.95)
+            self.animator.fade(self.unplug_window, 0.95, start=0)
 
         main_frame = ctk.CTkFrame(self.unplug_window, fg_color="transparent")
         main_frame.place(relx=0.5, rely=0.5, anchor="center")
@@ -947,13 +1257,7 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
         row = 0
         if self.custom_logo_path and os.path.exists(self.custom_logo_path):
             try:
-                logo_img = Image.open(self.custom_logo_path)
-                target_size = 100
-                ratio = min(target_size / logo_img.size[0], target_size / logo_img.size[1])
-                new_width = int(logo_img.size[0] * ratio)
-                new_height = int(logo_img.size[1] * ratio)
-                logo_img = logo_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_img)
+                logo_photo = image_cache.photo(self.custom_logo_path, (100, 100), fit=True)
                 logo_label = ctk.CTkLabel(main_frame, image=logo_photo, text="")
                 logo_label.image = logo_photo
                 logo_label.pack(pady=(16, 8))
@@ -992,18 +1296,31 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
 
         self.prompt_start_time = time.time()
         self.unplug_window.after(int(PROMPT_TIMEOUT * 1000), add_close_button)
-        self.monitor_unplug()
+        self.timers.register("unplug_monitor", self.monitor_unplug, 500, idle_period_ms=500, run_now=True)
 
     def close_unplug_prompt(self):
-        global UNPLUG_PROMPT_ACTIVE
         if self.unplug_window and self.unplug_window.winfo_exists():
-            if not self.power_saving_mode:
-                for alpha in range(20, -1, -1):
-                    self.unplug_window.attributes('-alpha', alpha / 20)
-                    time.sleep(0.01)
-            self.unplug_window.destroy()
-            UNPLUG_PROMPT_ACTIVE = False
-            logger.info("Unplug prompt closed manually.")
+            window = self.unplug_window
+
+            def finish():
+                global UNPLUG_PROMPT_ACTIVE
+                if window.winfo_exists():
+                    window.destroy()
+                UNPLUG_PROMPT_ACTIVE = False
+                logger.info("Unplug prompt closed manually.")
+
+            self.fade_window(window, 0, on_done=finish)
+
+    def fade_window(self, window, end, on_done=None):
+        """Fade a window's opacity without blocking the Tk thread; instant in power-saving mode."""
+        if self.power_saving_mode:
+            self.animator.cancel(Animator.fade_key(window))
+            if end > 0:
+                window.attributes('-alpha', end)
+            if on_done:
+                on_done()
+            return
+        self.animator.fade(window, end, on_done=on_done)
 
     def monitor_unplug(self):
         global UNPLUG_PROMPT_ACTIVE
@@ -1011,28 +1328,24 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
             if not self.unplug_window.winfo_exists():
                 logger.info("Unplug window closed.")
                 UNPLUG_PROMPT_ACTIVE = False
-                return
-            battery = None
+                return False
+            battery = battery_sampler.get()
             max_retries = 3
             for attempt in range(max_retries):
-                try:
-                    battery = psutil.sensors_battery()
-                    if battery is not None:
-                        break
-                    logger.warning(f"Battery status None on attempt {attempt + 1}/{max_retries}")
-                    time.sleep(0.1)
-                except Exception as e:
-                    logger.error(f"Battery status error on attempt {attempt + 1}/{max_retries}: {e}")
-                    time.sleep(0.1)
+                if battery is not None:
+                    break
+                logger.warning(f"Battery status None on attempt {attempt + 1}/{max_retries}")
+                time.sleep(0.1)
+                battery = battery_sampler.sample()
             idle_time = get_idle_time()
             if battery and not battery.power_plugged:
                 self.close_unplug_prompt()
                 logger.info("Charger unplugged, closing prompt.")
-                return
+                return False
             elif idle_time >= IDLE_TIMEOUT:
                 self.close_unplug_prompt()
                 logger.info("System idle for 2 minutes, closing prompt.")
-                return
+                return False
             else:
                 elapsed_time = time.time() - self.prompt_start_time
                 if elapsed_time >= PROMPT_TIMEOUT:
@@ -1041,39 +1354,41 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
                     if elapsed_time >= PROMPT_TIMEOUT + 30:
                         self.close_unplug_prompt()
                         logger.warning("Prompt stuck after timeout, force closing.")
-                        return
+                        return False
                 else:
                     remaining = max(0, PROMPT_TIMEOUT - int(elapsed_time))
                     self.countdown_label.configure(text=f"Auto-close in {remaining}s")
-                    self.unplug_window.after(500, self.monitor_unplug)
         except Exception as e:
             logger.error(f"Error in monitor_unplug: {e}")
-            if self.unplug_window.winfo_exists():
-                self.unplug_window.after(500, self.monitor_unplug)
+            return bool(self.unplug_window.winfo_exists())
 
-    def check_prompt_queue(self):
-        try:
-            if not PROMPT_QUEUE.empty():
-                PROMPT_QUEUE.get_nowait()
-                battery = psutil.sensors_battery()
-                if battery and battery.percent >= self.unplug_threshold and battery.power_plugged and not UNPLUG_PROMPT_ACTIVE:
-                    self.show_unplug_prompt()
-        except queue.Empty:
-            pass
-        self.root.after(500, self.check_prompt_queue)
+    def handle_prompt_request(self, event=None):
+        if not PROMPT_SIGNAL.consume():
+            return
+        battery = battery_sampler.get()
+        if battery and battery.percent >= self.unplug_threshold and battery.power_plugged and not UNPLUG_PROMPT_ACTIVE:
+            self.show_unplug_prompt()
 
     def minimize_to_tray(self):
         global MINIMIZED_TO_TRAY
+        if not self.owns_monitor:
+            # Nothing to keep resident; the daemon goes on monitoring
+            quit_app(self)
+            return
         logger.info("Minimizing to tray...")
         MINIMIZED_TO_TRAY = True
-        if not self.power_saving_mode:
-            for alpha in range(20, -1, -1):
-                self.root.attributes('-alpha', alpha / 20)
-                time.sleep(0.01)
-        self.root.withdraw()
-        if self.tray:
-            self.tray.update_menu()
-        logger.info("Minimized to tray successfully.")
+        self.timers.set_idle(True)
+
+        def hide():
+            self.root.withdraw()
+            if self.tray:
+                self.tray.update_menu()
+            if LEAN_TRAY:
+                self.release_ui()
+            logger.info("Minimized to tray successfully.")
+
+        # Restoring before the fade ends cancels it, so the window is never withdrawn
+        self.fade_window(self.root, 0, on_done=hide)
 
     def show_main_screen(self):
         global MINIMIZED_TO_TRAY
@@ -1081,17 +1396,15 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
         was_minimized = MINIMIZED_TO_TRAY
         if was_minimized:
             logger.info("Restoring from tray...")
+            if self.ui_released:
+                self.rebuild_ui()
             self.root.deiconify()
             screen_width = self.root.winfo_screenwidth()
             screen_height = self.root.winfo_screenheight()
             x = (screen_width - WINDOW_WIDTH) // 2
             y = (screen_height - WINDOW_HEIGHT) // 2
             self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
-            if not self.power_saving_mode:
-                for alpha in range(0, 21):
-                    self.root.attributes('-alpha', alpha / 20)
-                    time.sleep(0.01)
-                self.root.attributes('-alpha', 0.95)
+            self.fade_window(self.root, 0.95)
             self.root.lift()
             self.root.focus_force()
             self.root.attributes('-topmost', True)
@@ -1100,16 +1413,50 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
             self.root.update()
             self.check_unplug_prompt_on_restore()
             MINIMIZED_TO_TRAY = False
+            self.timers.set_idle(False)
         self.show_home_page()
-        battery = psutil.sensors_battery()
-        self.update_battery_ui(battery.percent if battery else 0,
-                               battery.power_plugged if battery else False)
         self.update_system_stats()
         logger.info("Main screen displayed.")
 
+    def release_ui(self):
+        """Destroy every page and the sidebar while in the tray; restoring rebuilds them from the view-models."""
+        process = psutil.Process()
+        rss_before = process.memory_info().rss
+        self.clear_left_frame()
+        self.clear_right_frame()
+        self.diagnostic_widgets = {}
+        self.home_labels.bind([])
+        self.home_view = None
+        if image_cache.loaded:
+            image_cache.clear()
+        self.root.update_idletasks()
+        gc.collect()
+        # Nothing created so far will be garbage while we sit in the tray; keep it out of future collections
+        gc.freeze()
+        rss_after = process.memory_info().rss
+        self.lean_tray_rss = (rss_before, rss_after)
+        self.ui_released = True
+        logger.info(f"Lean tray: RSS {rss_before / 1e6:.1f} MB -> {rss_after / 1e6:.1f} MB "
+                    f"({(rss_before - rss_after) / 1e6:.1f} MB released)")
+
+    def rebuild_ui(self):
+        gc.unfreeze()
+        self.setup_left_panel()
+        self.show_home_page()
+        self.ui_released = False
+        logger.info(f"Rebuilt UI after lean tray, RSS {psutil.Process().memory_info().rss / 1e6:.1f} MB")
+
+    def application_diagnostics(self):
+        items = [f"UI Timer Wakeups: {self.timers.wakeups_per_minute}/min",
+                 f"Memory (RSS): {psutil.Process().memory_info().rss / 1e6:.1f} MB"]
+        if self.lean_tray_rss:
+            before, after = self.lean_tray_rss
+            items.append(f"Last Lean Tray: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+        return items
+
     def check_unplug_prompt_on_restore(self):
         logger.info("Checking for unplug prompt on restore...")
-        battery = psutil.sensors_battery()
+        battery = battery_sampler.get()
         if battery and battery.percent >= self.unplug_threshold and battery.power_plugged:
             self.show_unplug_prompt()
         else:
@@ -1121,12 +1468,39 @@ Copyright © {time.strftime("%Y")} Save My Cell Team. All rights reserved.
             self.is_dark_mode = new_theme
             self.appearance_mode = "dark" if new_theme else "light"
             self.change_appearance_mode(self.appearance_mode)
+            self.update_tray_icon(battery_sampler.get())
             self.show_main_screen()
-        self.root.after(1000, self.check_theme_change)
 
     def run(self):
         self.root.mainloop()
 
+def report_first_paint(app):
+    """Print the time from process start to the first drawn frame, then quit (see benchmarks/bench_startup.py)."""
+    app.root.update_idletasks()
+    elapsed_ms = (time.time() - psutil.Process().create_time()) * 1000
+    print(f"first_paint_ms={elapsed_ms:.1f}", flush=True)
+    quit_app(app)
+
+def report_lean_tray(app):
+    """Build every page, release and rebuild the UI, print the RSS at each step, then quit (see benchmarks/bench_lean_tray.py)."""
+    for show in (app.show_system_diagnostics, app.show_about_page, app.show_settings_page, app.show_home_page):
+        show()
+        app.root.update_idletasks()
+    app.root.withdraw()
+    app.release_ui()
+    before, after = app.lean_tray_rss
+    app.rebuild_ui()
+    app.root.update_idletasks()
+    rebuilt = psutil.Process().memory_info().rss
+    print(f"lean_tray_rss_before={before} lean_tray_rss_after={after} lean_tray_rss_rebuilt={rebuilt}", flush=True)
+    quit_app(app)
+
 if __name__ == "__main__":
     app = BatteryMonitorApp()
-    app.run()
\ No newline at end of file
+    INSTANCE.serve({"restore": app.handle_restore_request})
+    if os.environ.get(STARTUP_PROBE_ENV):
+        app.root.after_idle(lambda: report_first_paint(app))
+    elif os.environ.get(LEAN_TRAY_PROBE_ENV):
+        app.root.after_idle(lambda: report_lean_tray(app))
+    app.run()
+    INSTANCE.release()
\ No newline at end of file
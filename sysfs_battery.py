@@ -0,0 +1,139 @@
+import logging
+import os
+import sys
+from typing import NamedTuple, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+SYSFS_POWER_SUPPLY = "/sys/class/power_supply"
+SYSFS_ROOT_ENV = "SAVEMYCELL_SYSFS_ROOT"
+READ_SIZE = 64
+
+# Attribute name -> alternatives, in the order psutil would try them
+BATTERY_ATTRIBUTES = {
+    "capacity": ("capacity",),
+    "status": ("status",),
+    "energy_now": ("energy_now", "charge_now"),
+    "power_now": ("power_now", "current_now"),
+}
+
+
+class SysfsBattery(NamedTuple):
+    percent: float
+    secsleft: int
+    power_plugged: Optional[bool]
+
+
+class SysfsBatteryReader:
+    """Battery provider that reads sysfs attributes through persistent descriptors.
+
+    Each attribute file is opened once and re-read with os.pread at offset 0,
+    which makes the kernel regenerate its value without a path lookup, open or
+    close per sample. Call the instance to get a psutil-compatible reading.
+    """
+
+    def __init__(self, root: str = SYSFS_POWER_SUPPLY):
+        self.root = root
+        self._fds = {}
+        self._online_fd = None
+        self._open()
+
+    def _open(self):
+        supplies = sorted(os.listdir(self.root))
+        batteries = [name for name in supplies if name.startswith("BAT") or "battery" in name.lower()]
+        if not batteries:
+            raise FileNotFoundError(f"No battery found under {self.root}")
+        battery_dir = os.path.join(self.root, batteries[0])
+        for attribute, candidates in BATTERY_ATTRIBUTES.items():
+            for candidate in candidates:
+                path = os.path.join(battery_dir, candidate)
+                if os.path.exists(path):
+                    self._fds[attribute] = os.open(path, os.O_RDONLY)
+                    break
+        if "capacity" not in self._fds:
+            self.close()
+            raise FileNotFoundError(f"No capacity attribute in {battery_dir}")
+        for name in supplies:
+            online_path = os.path.join(self.root, name, "online")
+            if name not in batteries and os.path.exists(online_path):
+                self._online_fd = os.open(online_path, os.O_RDONLY)
+                break
+        logger.info(f"Reading battery from {battery_dir} via persistent sysfs descriptors.")
+
+    def _read(self, attribute: str) -> Optional[str]:
+        fd = self._fds.get(attribute)
+        if fd is None:
+            return None
+        return os.pread(fd, READ_SIZE, 0).decode().strip()
+
+    def _read_int(self, attribute: str) -> Optional[int]:
+        try:
+            value = self._read(attribute)
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def __call__(self) -> Optional[SysfsBattery]:
+        try:
+            return self._sample()
+        except OSError as e:
+            # The battery was removed or the driver rebound; reopen once.
+            logger.warning(f"Sysfs battery read failed, reopening descriptors: {e}")
+            self.close()
+            try:
+                self._open()
+                return self._sample()
+            except OSError as e:
+                logger.error(f"Sysfs battery unavailable: {e}")
+                return None
+
+    def _sample(self) -> Optional[SysfsBattery]:
+        percent = self._read_int("capacity")
+        if percent is None:
+            # Some drivers briefly report garbage; psutil can still derive the level from energy_now/energy_full
+            logger.debug("Unreadable sysfs capacity, falling back to psutil.")
+            return psutil.sensors_battery()
+        energy_now = self._read_int("energy_now")
+        power_now = self._read_int("power_now")
+
+        if self._online_fd is not None:
+            power_plugged = os.pread(self._online_fd, READ_SIZE, 0).strip() == b"1"
+        else:
+            status = (self._read("status") or "").lower()
+            power_plugged = {"discharging": False, "charging": True, "full": True}.get(status)
+
+        if power_plugged:
+            secsleft = psutil.POWER_TIME_UNLIMITED
+        elif energy_now is not None and power_now:
+            secsleft = int(energy_now / power_now * 3600)
+        else:
+            secsleft = psutil.POWER_TIME_UNKNOWN
+        return SysfsBattery(percent, secsleft, power_plugged)
+
+    def close(self):
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds = {}
+        if self._online_fd is not None:
+            os.close(self._online_fd)
+            self._online_fd = None
+
+
+def open_sysfs_battery_reader(root: Optional[str] = None) -> Optional[SysfsBatteryReader]:
+    """Return a sysfs reader on Linux, or None so callers fall back to psutil.
+
+    The tree defaults to /sys/class/power_supply and can be redirected with the
+    SAVEMYCELL_SYSFS_ROOT environment variable, e.g. at a fake tree for testing.
+    """
+    root = root or os.environ.get(SYSFS_ROOT_ENV)
+    if root is None:
+        if not sys.platform.startswith("linux"):
+            return None
+        root = SYSFS_POWER_SUPPLY
+    try:
+        return SysfsBatteryReader(root)
+    except OSError as e:
+        logger.warning(f"Sysfs battery reader unavailable, using psutil: {e}")
+        return None
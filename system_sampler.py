@@ -0,0 +1,93 @@
+import collections
+import logging
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 10
+DEFAULT_WINDOW = 30  # samples, i.e. five minutes at the default interval
+DEFAULT_DISK_PATH = "/"
+
+
+class WindowStats(NamedTuple):
+    current: float
+    minimum: float
+    average: float
+    maximum: float
+
+
+class SystemSnapshot(NamedTuple):
+    timestamp: float
+    memory_used: int
+    memory_total: int
+    disk_used: int
+    disk_total: int
+
+
+class SystemSampler:
+    """Low-rate background sampler of CPU, memory and disk usage.
+
+    CPU usage is measured by psutil.cpu_percent() between consecutive
+    samples, so every value covers a full interval rather than whatever
+    happened since an unrelated earlier call. Readers get rolling-window
+    statistics without taking measurements of their own.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, window: int = DEFAULT_WINDOW,
+                 disk_path: str = DEFAULT_DISK_PATH):
+        self.interval = interval
+        self.disk_path = disk_path
+        self._lock = threading.Lock()
+        self._series = {name: collections.deque(maxlen=window) for name in ("cpu", "memory", "disk")}
+        self._latest: Optional[SystemSnapshot] = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            # Prime the CPU counter so the first real sample covers one interval
+            psutil.cpu_percent(interval=None)
+            self._thread = threading.Thread(target=self._run, name="system-sampler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        # The first sample comes quickly so the diagnostics page has data early
+        delay = min(1.0, self.interval)
+        while not self._stop.wait(delay):
+            delay = self.interval
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"System sampling failed: {e}")
+
+    def sample(self):
+        cpu = psutil.cpu_percent(interval=None)
+        mem = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+        with self._lock:
+            self._series["cpu"].append(cpu)
+            self._series["memory"].append(mem.percent)
+            self._series["disk"].append(disk.percent)
+            self._latest = SystemSnapshot(time.time(), mem.used, mem.total, disk.used, disk.total)
+
+    @property
+    def latest(self) -> Optional[SystemSnapshot]:
+        return self._latest
+
+    def stats(self) -> Dict[str, Optional[WindowStats]]:
+        """min/avg/max over the rolling window for cpu, memory and disk (percent)."""
+        with self._lock:
+            result = {}
+            for name, series in self._series.items():
+                if series:
+                    result[name] = WindowStats(series[-1], min(series), sum(series) / len(series), max(series))
+                else:
+                    result[name] = None
+            return result
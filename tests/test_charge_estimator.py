@@ -0,0 +1,46 @@
+import pytest
+
+from charge_estimator import LEARNING_RATE, ChargeTimeEstimator, prior_seconds_per_percent
+
+
+def charge(estimator, start, samples):
+    """Feed (seconds since start, percent) samples of one plugged-in session."""
+    for offset, percent in samples:
+        estimator.observe(start + offset, percent, True)
+
+
+def test_single_percent_steps_learn_from_crossing_midpoints():
+    estimator = ChargeTimeEstimator()
+    # Crossings into 51 and 52 fall halfway between the bracketing samples: 105 s and 205 s
+    charge(estimator, 1000, [(0, 50.2), (100, 50.9), (110, 51.0), (200, 51.8), (210, 52.1)])
+    expected = prior_seconds_per_percent(51) + LEARNING_RATE * (100 - prior_seconds_per_percent(51))
+    assert estimator.seconds_per_percent[51] == pytest.approx(expected)
+    assert estimator.observations[51] == 1
+    assert estimator.observations[50] == 0  # the first step has no known start
+    assert estimator.generation == 1
+
+
+def test_multi_percent_jump_is_not_learned():
+    estimator = ChargeTimeEstimator()
+    charge(estimator, 1000, [(0, 50.5), (10, 51.0), (610, 55.0), (620, 55.5), (700, 56.0), (800, 57.0)])
+    # The entry time into 55 is unknown, so the first bucket learned is 56: entered at 660 s, left at 750 s
+    assert list(estimator.observations[50:56]) == [0] * 6
+    assert estimator.observations[56] == 1
+    assert estimator.seconds_per_percent[56] == pytest.approx(
+        prior_seconds_per_percent(56) + LEARNING_RATE * (90 - prior_seconds_per_percent(56)))
+
+
+def test_replaying_saved_samples_does_not_relearn(tmp_path):
+    path = str(tmp_path / "profile.json")
+    samples = [(i * 70, 50 + i * 0.5) for i in range(40)]
+    estimator = ChargeTimeEstimator()
+    charge(estimator, 1000, samples)
+    estimator.end_session()
+    assert estimator.save(path)
+    learned = list(estimator.seconds_per_percent)
+
+    restarted = ChargeTimeEstimator()
+    assert restarted.load(path)
+    charge(restarted, 1000, samples)
+    assert list(restarted.seconds_per_percent) == learned
+    assert not restarted.dirty
@@ -0,0 +1,115 @@
+import os
+import sys
+import threading
+import time
+
+import psutil
+import pytest
+
+from battery_snapshot import BatterySampler
+from monitor_daemon import POWER_EVENT_FALLBACK_INTERVAL, DaemonTray, MonitorDaemon
+from power_events import FakePowerEventSource
+
+
+class FakeBattery:
+    """Battery whose reading the test changes, as psutil.sensors_battery() would see it."""
+
+    def __init__(self, percent, power_plugged):
+        self.set(percent, power_plugged)
+
+    def set(self, percent, power_plugged):
+        self.percent = percent
+        self.power_plugged = power_plugged
+        self.secsleft = psutil.POWER_TIME_UNLIMITED if power_plugged else 3600
+
+    def read(self):
+        return self
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def battery():
+    return FakeBattery(50, False)
+
+
+@pytest.fixture
+def make_daemon(state_dir, battery):
+    daemons = []
+
+    def make(events=None):
+        daemon = MonitorDaemon(state_dir, sampler=BatterySampler(reader=battery.read), events=events,
+                               prompt_command=[sys.executable, "-c", "pass"])
+        daemons.append(daemon)
+        return daemon
+
+    yield make
+    for daemon in daemons:
+        daemon.stop()
+        if daemon.history_log:
+            daemon.history_log.close()
+
+
+def test_power_event_wakes_daemon_before_fallback(make_daemon, battery):
+    events = FakePowerEventSource()
+    daemon = make_daemon(events)
+    thread = threading.Thread(target=daemon.run, daemon=True)
+    thread.start()
+    assert wait_until(lambda: daemon.last_battery is not None)
+    assert not daemon.last_battery.power_plugged
+
+    # Unplugged with events, the daemon sleeps for the fallback interval; only the event can wake it
+    battery.set(95, True)
+    events.emit("change", "AC", online="1")
+    assert wait_until(lambda: daemon.last_battery.power_plugged)
+    assert daemon.last_battery.percent == 95
+    assert wait_until(lambda: daemon._prompt is not None)
+
+    daemon.stop()
+    thread.join(5)
+    assert not thread.is_alive()
+
+
+def test_unplugged_interval_relies_on_events(make_daemon):
+    assert make_daemon().step() == 120
+    assert make_daemon(FakePowerEventSource()).step() >= POWER_EVENT_FALLBACK_INTERVAL
+
+
+def test_prompt_cooldown_without_replug(make_daemon, battery):
+    daemon = make_daemon(FakePowerEventSource())
+    battery.set(95, True)
+    daemon.step()
+    first = daemon._prompt
+    assert first is not None
+    first.wait(5)
+    daemon.step()
+    assert daemon._prompt is first
+
+
+def test_charge_profile_lives_in_state_dir(make_daemon, state_dir):
+    daemon = make_daemon()
+    assert daemon.estimator.path == os.path.join(state_dir, "charge_profile.json")
+    daemon.estimator.dirty = True
+    daemon.step()
+    assert os.path.exists(daemon.estimator.path)
+
+
+def test_tray_follows_each_sample(make_daemon, battery, monkeypatch):
+    monkeypatch.setenv("PYSTRAY_BACKEND", "dummy")
+    pytest.importorskip("pystray")
+    daemon = make_daemon()
+    tray = DaemonTray(daemon)
+    daemon.on_battery = tray.update
+
+    daemon.step()
+    assert tray.icon.title == "Save My Cell - 50%"
+    battery.set(51, True)
+    daemon.step()
+    assert tray.icon.title == "Save My Cell - 51% (charging)"
@@ -0,0 +1,79 @@
+import threading
+import time
+import types
+
+import pytest
+
+from power_events import (CAPACITY, PLUG, UNPLUG, FakePowerEventSource, event_driven_interval,
+                          parse_uevent, wait_for_power_event)
+
+FALLBACK = 600
+COOLDOWN = 300
+
+
+def uevent(action, **env):
+    fields = [f"{action}@/devices/platform/power_supply".encode()]
+    fields += [f"{key}={value}".encode() for key, value in env.items()]
+    return b"\0".join(fields)
+
+
+def test_parse_uevent_classifies_power_supply_events():
+    plug = parse_uevent(uevent("change", SUBSYSTEM="power_supply", POWER_SUPPLY_NAME="AC",
+                               POWER_SUPPLY_TYPE="Mains", POWER_SUPPLY_ONLINE="1"))
+    assert (plug.kind, plug.device) == (PLUG, "AC")
+    unplug = parse_uevent(uevent("change", SUBSYSTEM="power_supply", POWER_SUPPLY_NAME="AC",
+                                 POWER_SUPPLY_TYPE="Mains", POWER_SUPPLY_ONLINE="0"))
+    assert unplug.kind == UNPLUG
+    capacity = parse_uevent(uevent("change", SUBSYSTEM="power_supply", POWER_SUPPLY_NAME="BAT0",
+                                   POWER_SUPPLY_TYPE="Battery", POWER_SUPPLY_ONLINE="1",
+                                   POWER_SUPPLY_CAPACITY="81"))
+    assert capacity.kind == CAPACITY
+    assert parse_uevent(uevent("add", SUBSYSTEM="usb")) is None
+    assert parse_uevent(b"libudev\0garbage") is None
+
+
+def test_unplugged_interval_stretches_to_fallback():
+    assert event_driven_interval(120, False, False, None, FALLBACK, COOLDOWN) == FALLBACK
+    assert event_driven_interval(900, False, False, None, FALLBACK, COOLDOWN) == 900
+
+
+def test_interval_waits_out_prompt_cooldown_above_threshold():
+    assert event_driven_interval(5, True, True, 100, FALLBACK, COOLDOWN) == 200
+    assert event_driven_interval(5, True, True, None, FALLBACK, COOLDOWN) == 5
+    assert event_driven_interval(5, True, True, 400, FALLBACK, COOLDOWN) == 5
+
+
+def test_charging_below_threshold_keeps_polling():
+    assert event_driven_interval(120, True, False, 100, FALLBACK, COOLDOWN) == 120
+
+
+def test_wait_returns_early_on_event():
+    events = FakePowerEventSource()
+    threading.Timer(0.05, events.emit, args=(PLUG,)).start()
+    started = time.monotonic()
+    event = wait_for_power_event(events, 10)
+    assert event.kind == PLUG
+    assert time.monotonic() - started < 5
+
+
+def test_wait_times_out_without_event():
+    assert wait_for_power_event(FakePowerEventSource(), 0.05) is None
+    started = time.monotonic()
+    assert wait_for_power_event(None, 0.05) is None
+    assert time.monotonic() - started >= 0.05
+
+
+def test_battery_monitor_uses_events():
+    # smc.py imports winreg, so the app's monitor can only be driven on Windows
+    pytest.importorskip("winreg")
+    import smc
+
+    events = FakePowerEventSource()
+    monitor = smc.BatteryMonitor(types.SimpleNamespace(unplug_threshold=90), events=events)
+    unplugged = types.SimpleNamespace(percent=50, power_plugged=False)
+    assert monitor.event_driven_interval(unplugged, 120, time.time()) == smc.POWER_EVENT_FALLBACK_INTERVAL
+    monitor.last_unplug_prompt_time = 1000
+    full = types.SimpleNamespace(percent=95, power_plugged=True)
+    assert monitor.event_driven_interval(full, 5, 1100) == smc.UNPLUG_PROMPT_COOLDOWN - 100
+    events.emit(UNPLUG)
+    assert monitor.wait(10).kind == UNPLUG
@@ -0,0 +1,58 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from report_pipeline import BatteryReportJob
+
+FAKE_POWERCFG = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools", "fake_powercfg.py")
+
+
+def fake_powercfg(*flags):
+    return [sys.executable, FAKE_POWERCFG, "/batteryreport", "/output", "{output}", *flags]
+
+
+def refresh_and_wait(job, timeout=15):
+    done = threading.Event()
+    result = []
+
+    def on_done(ok):
+        result.append(ok)
+        done.set()
+
+    assert job.refresh(on_done=on_done)
+    assert done.wait(timeout)
+    assert not job.running
+    return result[0]
+
+
+@pytest.fixture
+def report_path(tmp_path):
+    return str(tmp_path / "battery_report.html")
+
+
+def test_refresh_parses_generated_report(report_path):
+    job = BatteryReportJob(report_path, command=fake_powercfg("--cycles", "42"))
+    assert refresh_and_wait(job)
+    assert os.path.exists(report_path)
+    assert not os.path.exists(report_path + ".partial.html")
+    assert job.metrics() == {
+        "design_capacity": "57,000 mWh",
+        "full_charge_capacity": "51,300 mWh",
+        "cycle_count": "42",
+    }
+
+
+def test_timeout_kills_command_and_keeps_previous_report(report_path):
+    assert refresh_and_wait(BatteryReportJob(report_path, command=fake_powercfg("--cycles", "7")))
+    job = BatteryReportJob(report_path, command=fake_powercfg("--delay", "30"), timeout=0.5)
+    assert not refresh_and_wait(job)
+    assert job.metrics()["cycle_count"] == "7"
+
+
+def test_nonzero_exit_reports_failure(report_path):
+    job = BatteryReportJob(report_path, command=fake_powercfg("--fail"))
+    assert not refresh_and_wait(job)
+    assert not os.path.exists(report_path)
+    assert job.metrics()["cycle_count"] is None
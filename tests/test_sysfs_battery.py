@@ -0,0 +1,50 @@
+import os
+
+import psutil
+import pytest
+
+from sysfs_battery import SysfsBattery, SysfsBatteryReader
+
+FAKE_SUPPLIES = {
+    "AC": {"type": "Mains", "online": "0"},
+    "BAT0": {
+        "type": "Battery",
+        "capacity": "87",
+        "status": "Discharging",
+        "energy_now": "43500000",
+        "power_now": "9000000",
+    },
+}
+
+
+@pytest.fixture
+def sysfs_root(tmp_path):
+    for supply, attributes in FAKE_SUPPLIES.items():
+        os.makedirs(tmp_path / supply)
+        for name, value in attributes.items():
+            (tmp_path / supply / name).write_text(value + "\n")
+    return tmp_path
+
+
+def test_reads_battery_through_descriptors(sysfs_root):
+    reader = SysfsBatteryReader(str(sysfs_root))
+    battery = reader()
+    assert (battery.percent, battery.power_plugged) == (87, False)
+    assert battery.secsleft == int(43500000 / 9000000 * 3600)
+
+    (sysfs_root / "AC" / "online").write_text("1\n")
+    (sysfs_root / "BAT0" / "capacity").write_text("88\n")
+    battery = reader()
+    assert (battery.percent, battery.power_plugged, battery.secsleft) == (88, True, psutil.POWER_TIME_UNLIMITED)
+    reader.close()
+
+
+def test_unreadable_capacity_falls_back_to_psutil(sysfs_root, monkeypatch):
+    reader = SysfsBatteryReader(str(sysfs_root))
+    fallback = SysfsBattery(61, 1800, False)
+    monkeypatch.setattr(psutil, "sensors_battery", lambda: fallback)
+    (sysfs_root / "BAT0" / "capacity").write_text("garbage\n")
+    assert reader() is fallback
+    monkeypatch.setattr(psutil, "sensors_battery", lambda: None)
+    assert reader() is None
+    reader.close()
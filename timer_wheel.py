@@ -0,0 +1,122 @@
+import collections
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COALESCE_MS = 100
+WAKEUP_WINDOW_SECONDS = 60
+
+
+def _now_ms() -> float:
+    return time.monotonic() * 1000
+
+
+class TimerTask:
+    def __init__(self, name: str, callback: Callable[[], Optional[bool]], period_ms: int,
+                 idle_period_ms: Optional[int]):
+        self.name = name
+        self.callback = callback
+        self.period_ms = period_ms
+        self.idle_period_ms = idle_period_ms
+        self.next_due = 0.0
+
+    def period(self, idle: bool) -> Optional[int]:
+        """Period for the current policy; None means the task is paused."""
+        return self.idle_period_ms if idle else self.period_ms
+
+
+class TkTimerWheel:
+    """One root.after() timer shared by every periodic task on the Tk thread.
+
+    Tasks register with an active period and an idle period (None pauses the
+    task while idle, e.g. when minimized to the tray). Tasks due within
+    coalesce_ms of each other run in the same wakeup, and no timer is armed
+    at all when nothing is due. A callback returning False unregisters itself.
+    """
+
+    def __init__(self, root, coalesce_ms: int = DEFAULT_COALESCE_MS):
+        self.root = root
+        self.coalesce_ms = coalesce_ms
+        self.idle = False
+        self._tasks: Dict[str, TimerTask] = {}
+        self._after_id = None
+        self._ticking = False
+        self._wakeups = collections.deque()
+
+    def register(self, name: str, callback: Callable[[], Optional[bool]], period_ms: int,
+                 idle_period_ms: Optional[int] = None, run_now: bool = False):
+        task = TimerTask(name, callback, period_ms, idle_period_ms)
+        task.next_due = _now_ms() + (0 if run_now else period_ms)
+        self._tasks[name] = task
+        self._plan()
+        return task
+
+    def unregister(self, name: str):
+        if self._tasks.pop(name, None):
+            self._plan()
+
+    def wake(self, name: str):
+        """Run a registered task on the next tick instead of waiting for its period."""
+        task = self._tasks.get(name)
+        if task:
+            task.next_due = _now_ms()
+            self._plan()
+
+    def set_idle(self, idle: bool):
+        if idle == self.idle:
+            return
+        self.idle = idle
+        now = _now_ms()
+        for task in self._tasks.values():
+            period = task.period(idle)
+            if period is not None:
+                task.next_due = min(task.next_due, now + period) if task.next_due > now else now
+        self._plan()
+
+    @property
+    def wakeups_per_minute(self) -> int:
+        self._expire_wakeups(time.monotonic())
+        return len(self._wakeups)
+
+    def _expire_wakeups(self, now: float):
+        while self._wakeups and now - self._wakeups[0] > WAKEUP_WINDOW_SECONDS:
+            self._wakeups.popleft()
+
+    def _plan(self):
+        if self._ticking:
+            return
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        due = [task.next_due for task in self._tasks.values() if task.period(self.idle) is not None]
+        if not due:
+            return
+        delay = max(0, int(min(due) - _now_ms()))
+        self._after_id = self.root.after(delay, self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        self._ticking = True
+        now = _now_ms()
+        self._wakeups.append(now / 1000)
+        self._expire_wakeups(now / 1000)
+        try:
+            for task in list(self._tasks.values()):
+                period = task.period(self.idle)
+                if period is None or task.next_due > now + self.coalesce_ms:
+                    continue
+                try:
+                    keep = task.callback()
+                except Exception as e:
+                    logger.error(f"Timer task '{task.name}' failed: {e}")
+                    keep = True
+                if keep is False:
+                    if self._tasks.get(task.name) is task:
+                        del self._tasks[task.name]
+                else:
+                    task.next_due = now + period
+        finally:
+            self._ticking = False
+        self._plan()
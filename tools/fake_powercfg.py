@@ -0,0 +1,47 @@
+"""Stand-in for `powercfg /batteryreport` on machines without it.
+
+Point the app at it with:
+    SAVEMYCELL_REPORT_COMMAND="python tools/fake_powercfg.py /batteryreport /output {output}"
+Optional flags: --delay SECONDS to simulate a slow report, --fail to exit non-zero.
+"""
+import argparse
+import sys
+import time
+
+REPORT = """<!DOCTYPE html><html><head><title>Battery report</title></head><body>
+<h1>Battery report</h1>
+<table><tr><td>COMPUTER NAME</td><td>FAKE-PC</td></tr></table>
+<h2>Installed batteries</h2>
+<table>
+<tr><td><span class="label">NAME</span></td><td>Fake Battery</td></tr>
+<tr><td><span class="label">DESIGN CAPACITY</span></td><td>{design:,} mWh</td></tr>
+<tr><td><span class="label">FULL CHARGE CAPACITY</span></td><td>{full:,} mWh</td></tr>
+<tr><td><span class="label">CYCLE COUNT</span></td><td>{cycles}</td></tr>
+</table>
+</body></html>
+"""
+
+
+def main():
+    # powercfg-style "/output PATH" is picked out before argparse sees the rest
+    argv = sys.argv[1:]
+    if "/output" not in argv or argv.index("/output") + 1 >= len(argv):
+        print("usage: fake_powercfg.py /batteryreport /output PATH [--delay S] [--fail]", file=sys.stderr)
+        return 2
+    output = argv[argv.index("/output") + 1]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--delay", type=float, default=0)
+    parser.add_argument("--fail", action="store_true")
+    parser.add_argument("--design", type=int, default=57000)
+    parser.add_argument("--full", type=int, default=51300)
+    parser.add_argument("--cycles", type=int, default=312)
+    args, _ = parser.parse_known_args(argv)
+    time.sleep(args.delay)
+    if args.fail:
+        return 1
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(REPORT.format(design=args.design, full=args.full, cycles=args.cycles))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import functools
+import threading
+from typing import Dict, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+DEFAULT_ICON_SIZE = 32
+GLYPHS = "0123456789"
+FONT_CANDIDATES = ("segoeuib.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf")
+LOW_BATTERY_PERCENT = 20
+
+THEMES = {
+    False: {"background": "#F3F3F3", "border": "#C8C8C8", "text": "#000000"},
+    True: {"background": "#2D2D2D", "border": "#646464", "text": "#FFFFFF"},
+}
+LEVEL_COLOR = "#2CC985"
+LOW_LEVEL_COLOR = "#FF4500"
+CHARGING_COLOR = "#FFC107"
+
+
+def _load_font(pixel_size: int):
+    for name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(name, pixel_size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(pixel_size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+class GlyphAtlas:
+    """Digit sprites and the static icon layers for one theme, rendered once.
+
+    All digits are drawn onto a single sheet and cut into RGBA sprites with
+    a shared height, so composing a frame is only a handful of composites.
+    """
+
+    def __init__(self, size: int, dark: bool):
+        self.size = size
+        colors = THEMES[dark]
+        self.bar_height = max(3, size // 5)
+        self.text_height = size - self.bar_height - 3
+
+        font = self._fit_font(size)
+        boxes = {glyph: font.getbbox(glyph) for glyph in GLYPHS}
+        top = min(box[1] for box in boxes.values())
+        bottom = max(box[3] for box in boxes.values())
+        widths = {glyph: box[2] - box[0] for glyph, box in boxes.items()}
+        self.glyph_height = bottom - top
+
+        sheet = Image.new("RGBA", (sum(widths.values()), self.glyph_height), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(sheet)
+        self.sprites: Dict[str, Image.Image] = {}
+        x = 0
+        for glyph in GLYPHS:
+            draw.text((x - boxes[glyph][0], -top), glyph, font=font, fill=colors["text"])
+            x += widths[glyph]
+        x = 0
+        for glyph in GLYPHS:
+            self.sprites[glyph] = sheet.crop((x, 0, x + widths[glyph], self.glyph_height))
+            x += widths[glyph]
+
+        self.base = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        ImageDraw.Draw(self.base).rounded_rectangle((0, 0, size - 1, size - 1), radius=max(2, size // 8),
+                                                    fill=colors["background"], outline=colors["border"])
+        self.bolt = self._render_bolt(self.bar_height + 2)
+
+    def _fit_font(self, size: int):
+        pixel_size = self.text_height + 2
+        while pixel_size > 6:
+            font = _load_font(pixel_size)
+            box = font.getbbox("100")
+            if box[2] - box[0] <= size - 2 and box[3] - box[1] <= self.text_height:
+                return font
+            pixel_size -= 1
+        return _load_font(pixel_size)
+
+    @staticmethod
+    def _render_bolt(height: int) -> Image.Image:
+        width = max(3, height * 2 // 3)
+        bolt = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        ImageDraw.Draw(bolt).polygon(
+            [(width * 0.6, 0), (0, height * 0.55), (width * 0.45, height * 0.55),
+             (width * 0.35, height), (width, height * 0.4), (width * 0.55, height * 0.4)],
+            fill=CHARGING_COLOR)
+        return bolt
+
+
+class TrayIconRenderer:
+    """Builds tray icon frames showing the charge level and charging state.
+
+    frame() is memoized per (percent, plugged, dark); glyph atlases are
+    built lazily once per theme. Safe to call from any thread.
+    """
+
+    def __init__(self, size: int = DEFAULT_ICON_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._atlases: Dict[bool, GlyphAtlas] = {}
+        self.frame = functools.lru_cache(maxsize=16)(self._compose)
+
+    def atlas(self, dark: bool) -> GlyphAtlas:
+        with self._lock:
+            atlas = self._atlases.get(dark)
+            if atlas is None:
+                atlas = self._atlases[dark] = GlyphAtlas(self.size, dark)
+            return atlas
+
+    def _compose(self, percent: int, plugged: bool, dark: bool) -> Image.Image:
+        atlas = self.atlas(dark)
+        size = self.size
+        image = atlas.base.copy()
+
+        text = str(max(0, min(100, percent)))
+        sprites = [atlas.sprites[glyph] for glyph in text]
+        x = (size - sum(sprite.width for sprite in sprites)) // 2
+        y = 1 + (atlas.text_height - atlas.glyph_height) // 2
+        for sprite in sprites:
+            image.alpha_composite(sprite, (x, y))
+            x += sprite.width
+
+        bar_top = size - atlas.bar_height - 2
+        bar_width = round((size - 4) * max(0, min(100, percent)) / 100)
+        color = LEVEL_COLOR if plugged or percent > LOW_BATTERY_PERCENT else LOW_LEVEL_COLOR
+        if bar_width:
+            image.paste(color, (2, bar_top, 2 + bar_width, size - 2))
+        if plugged:
+            bolt = atlas.bolt
+            image.alpha_composite(bolt, ((size - bolt.width) // 2, bar_top - 1))
+        return image
+
+    def frame_key(self, battery, dark: bool) -> Tuple[int, bool, bool]:
+        return round(battery.percent), bool(battery.power_plugged), bool(dark)
@@ -0,0 +1,6 @@
+"""Work-in-progress rewrite of the app, split into modules.
+
+Run from the repository root as a package, so its modules can share the
+top-level ones such as tween:
+    python -m trial.savemycell
+"""
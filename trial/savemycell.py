@@ -11,15 +11,16 @@ import queue
 import logging
 import os
 import winreg
-from PIL import Image, ImageTk
+from PIL import Image, ImageColor, ImageDraw, ImageTk
 from typing import Optional, Dict, Any
+import functools
 import json
 import sys
 import pystray
 import darkdetect # For light/dark mode detection
 
 # Import constants
-import constants
+from . import constants
 
 # Detect idle time on Windows
 try:
@@ -168,6 +169,21 @@ def get_idle_time() -> float:
         logger.error(f"Failed to get idle time: {e}")
         return 0
 
+PLACEHOLDER_SUPERSAMPLE = 4
+
+@functools.lru_cache(maxsize=32)
+def render_circular_placeholder(size: int, color: str, dark: bool) -> Image.Image:
+    """Filled circle with a thin theme-coloured border, drawn once per (size, color, theme)."""
+    scale = PLACEHOLDER_SUPERSAMPLE
+    border = (100, 100, 100, 255) if dark else (200, 200, 200, 255)
+    fill = ImageColor.getrgb(color)[:3] + (255,)
+    # Draw at a higher resolution and downsample for anti-aliased edges
+    image = Image.new("RGBA", (size * scale, size * scale), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((2 * scale, 2 * scale, (size - 2) * scale - 1, (size - 2) * scale - 1), fill=border)
+    draw.ellipse((3 * scale, 3 * scale, (size - 3) * scale - 1, (size - 3) * scale - 1), fill=fill)
+    return image.resize((size, size), Image.Resampling.LANCZOS)
+
 # Monitoring Logic
 class BatteryMonitor:
     def __init__(self, app):
@@ -309,6 +325,7 @@ class BatteryMonitorApp:
         self.display_name = getpass.getuser() # Default display name
         self.custom_logo_path = ""
         self.selected_theme_mode = "System" # "System", "Light", "Dark"
+        self._placeholder_photos = {}
 
         self.load_settings_from_file() # Load settings first to get preferred theme
 
@@ -615,24 +632,11 @@ class BatteryMonitorApp:
 
     def _create_circular_placeholder(self, parent_label, size, color):
         """Creates a circular image placeholder for the profile picture."""
-        image = Image.new("RGBA", (size, size), (0, 0, 0, 0)) # Transparent background
-        # Create a circle in the center
-        for x in range(size):
-            for y in range(size):
-                if (x - size/2)**2 + (y - size/2)**2 < (size/2 - 2)**2: # -2 for slight border
-                    # FIX: Changed (1,) to (1,1) in Image.new to resolve ValueError
-                    image.putpixel((x, y), Image.new("RGB", (1, 1), color).getpixel((0,0)) + (255,)) # Fill with color, full opacity
-        
-        # Optional: Add a subtle border
-        for x in range(size):
-            for y in range(size):
-                dist_sq = (x - size/2)**2 + (y - size/2)**2
-                if (size/2 - 3)**2 < dist_sq < (size/2)**2:
-                     current_color = image.getpixel((x,y))
-                     if current_color[3] > 0: # Only if it's not transparent
-                        image.putpixel((x,y), (100, 100, 100, 255) if self.is_dark_mode else (200,200,200,255)) # Darker border
-        
-        photo = ImageTk.PhotoImage(image)
+        key = (size, color, self.is_dark_mode)
+        photo = self._placeholder_photos.get(key) # Reused across theme switches and sidebar rebuilds
+        if photo is None:
+            photo = ImageTk.PhotoImage(render_circular_placeholder(*key))
+            self._placeholder_photos[key] = photo
         parent_label.config(image=photo)
         parent_label.image = photo # Keep reference
 
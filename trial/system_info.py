@@ -10,7 +10,7 @@ import sys
 import winreg
 from typing import Optional, Dict
 
-from constants import AUTO_START_REG_KEY, AUTO_START_APP_NAME
+from .constants import AUTO_START_REG_KEY, AUTO_START_APP_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -2,17 +2,18 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
 import os
 import time
 import logging
 from typing import Optional # Add this import
 
-from constants import (
+from .constants import (
     PROMPT_WINDOW_WIDTH, PROMPT_WINDOW_HEIGHT, PROMPT_TIMEOUT_SECONDS,
-    IDLE_TIMEOUT_SECONDS
+    IDLE_TIMEOUT_SECONDS, APP_DATA_PATH
 )
-from system_info import get_idle_time
+from .system_info import get_idle_time
+from tween import Animator
+from image_cache import ImageCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,8 @@ class UnplugPromptManager:
         self.prompt_start_time: float = 0
         self.close_callback = close_callback
         self._prompt_active = False
+        self.animator = Animator(parent_root)
+        self.image_cache = ImageCache(os.path.join(APP_DATA_PATH, "image_cache"))
 
     def is_prompt_active(self) -> bool:
         return self._prompt_active and self.unplug_window and self.unplug_window.winfo_exists()
@@ -61,14 +64,7 @@ class UnplugPromptManager:
         self.unplug_window.geometry(f"+{x}+{y}")
 
         if not self.settings_manager.power_saving_mode:
-            self.unplug_window.attributes('-alpha', 0)
-            for alpha in range(0, 21):
-                if not self.unplug_window.winfo_exists(): return
-                self.unplug_window.attributes('-alpha', alpha / 20)
-                self.parent_root.update_idletasks()
-                time.sleep(0.01)
-            if self.unplug_window.winfo_exists():
-                self.unplug_window.attributes('-alpha', 0.95)
+            self.animator.fade(self.unplug_window, 0.95, start=0)
 
         main_frame_prompt = ttk.Frame(self.unplug_window, style="Main.TFrame")
         main_frame_prompt.pack(fill="both", expand=True, padx=20, pady=20)
@@ -80,14 +76,7 @@ class UnplugPromptManager:
         custom_logo_path = self.settings_manager.custom_logo_path
         if custom_logo_path and os.path.exists(custom_logo_path):
             try:
-                logo_img = Image.open(custom_logo_path)
-                original_width, original_height = logo_img.size
-                target_size = 100
-                ratio = min(target_size / original_width, target_size / original_height)
-                new_width = int(original_width * ratio)
-                new_height = int(original_height * ratio)
-                logo_img = logo_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                self.logo_photo = ImageTk.PhotoImage(logo_img)
+                self.logo_photo = self.image_cache.photo(custom_logo_path, (100, 100), fit=True)
                 logo_label = ttk.Label(main_frame_prompt, image=self.logo_photo, background=self.settings_manager.background_color)
                 logo_label.grid(row=row_idx, column=0, pady=(0, 8), sticky="n")
                 row_idx += 1
@@ -126,19 +115,23 @@ class UnplugPromptManager:
 
     def close_prompt(self):
         if self.unplug_window and self.unplug_window.winfo_exists():
-            for alpha in range(20, -1, -1):
-                if not self.unplug_window.winfo_exists(): break
-                self.unplug_window.attributes('-alpha', alpha / 20)
-                self.parent_root.update_idletasks()
-                time.sleep(0.01)
-            if self.unplug_window.winfo_exists():
-                self.unplug_window.destroy()
-            self.unplug_window = None
-            self._prompt_active = False
-            self.logo_photo = None
-            if self.close_callback:
-                self.close_callback()
-            logger.info("Unplug prompt closed.")
+            window = self.unplug_window
+
+            def finish():
+                if window.winfo_exists():
+                    window.destroy()
+                if self.unplug_window is window:
+                    self.unplug_window = None
+                    self._prompt_active = False
+                    self.logo_photo = None
+                if self.close_callback:
+                    self.close_callback()
+                logger.info("Unplug prompt closed.")
+
+            if self.settings_manager.power_saving_mode:
+                finish()
+            else:
+                self.animator.fade(window, 0, on_done=finish)
 
     def _monitor_unplug_status(self, countdown_label):
         if not self.is_prompt_active():
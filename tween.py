@@ -0,0 +1,127 @@
+import logging
+import math
+import time
+import tkinter as tk
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRAME_MS = 16
+DEFAULT_FADE_MS = 200
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in_out_quad(t: float) -> float:
+    return 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_sine(t: float) -> float:
+    return -(math.cos(math.pi * t) - 1) / 2
+
+
+class Tween:
+    def __init__(self, key: str, setter: Callable[[float], None], start: float, end: float,
+                 duration_ms: float, easing: Callable[[float], float],
+                 on_done: Optional[Callable[[], None]]):
+        self.key = key
+        self.setter = setter
+        self.start = start
+        self.end = end
+        self.duration_ms = max(duration_ms, 1)
+        self.easing = easing
+        self.on_done = on_done
+        self.started_at = time.monotonic() * 1000
+        self.cancelled = False
+        self.finished = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def value_at(self, now_ms: float) -> float:
+        progress = min(1.0, (now_ms - self.started_at) / self.duration_ms)
+        return self.start + (self.end - self.start) * self.easing(progress)
+
+
+class Animator:
+    """Runs tweens from root.after() instead of sleeping on the Tk thread.
+
+    Progress is computed from elapsed time, so when the event loop is busy
+    late frames are simply skipped and the tween still ends on time. One
+    timer drives every active tween and nothing is scheduled while idle.
+    Starting a tween with a key already in use replaces the running one,
+    which lets a fade-out interrupt a fade-in smoothly.
+    """
+
+    def __init__(self, root, frame_ms: int = DEFAULT_FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self._tweens: Dict[str, Tween] = {}
+        self._after_id = None
+
+    def animate(self, key: str, setter: Callable[[float], None], start: float, end: float,
+                duration_ms: float = DEFAULT_FADE_MS, easing: Callable[[float], float] = ease_out_cubic,
+                on_done: Optional[Callable[[], None]] = None) -> Tween:
+        self.cancel(key)
+        tween = Tween(key, setter, start, end, duration_ms, easing, on_done)
+        self._tweens[key] = tween
+        # Apply the first frame now so nothing is drawn at the old value
+        self._step(tween, tween.started_at)
+        if self._after_id is None:
+            self._after_id = self.root.after(0, self._tick)
+        return tween
+
+    def cancel(self, key: str):
+        tween = self._tweens.pop(key, None)
+        if tween:
+            tween.cancel()
+
+    def is_running(self, key: str) -> bool:
+        return key in self._tweens
+
+    @staticmethod
+    def fade_key(window) -> str:
+        return f"{window}:alpha"
+
+    def fade(self, window, end: float, duration_ms: float = DEFAULT_FADE_MS,
+             on_done: Optional[Callable[[], None]] = None, start: Optional[float] = None) -> Tween:
+        """Tween a toplevel's -alpha from its current value (or start) to end."""
+        if start is None:
+            start = float(window.attributes('-alpha'))
+        return self.animate(self.fade_key(window), lambda alpha: window.attributes('-alpha', alpha),
+                            start, end, duration_ms, ease_in_out_sine, on_done)
+
+    def _step(self, tween: Tween, now_ms: float):
+        try:
+            tween.setter(tween.value_at(now_ms))
+            done = now_ms - tween.started_at >= tween.duration_ms
+        except tk.TclError as e:
+            # The widget went away mid-animation; finish so cleanup still runs
+            logger.debug(f"Ending tween {tween.key} early: {e}")
+            done = True
+        if not done:
+            return
+        tween.finished = True
+        if self._tweens.get(tween.key) is tween:
+            del self._tweens[tween.key]
+        if tween.on_done:
+            try:
+                tween.on_done()
+            except Exception as e:
+                logger.error(f"Tween {tween.key} completion callback failed: {e}")
+
+    def _tick(self):
+        self._after_id = None
+        frame_start = time.monotonic() * 1000
+        for tween in list(self._tweens.values()):
+            if not tween.cancelled:
+                self._step(tween, frame_start)
+        if self._tweens:
+            spent = time.monotonic() * 1000 - frame_start
+            self._after_id = self.root.after(max(1, int(self.frame_ms - spent)), self._tick)
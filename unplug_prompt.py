@@ -0,0 +1,69 @@
+"""Stand-alone unplug prompt launched by monitor_daemon.py.
+
+Plain Tk only, so it starts quickly and exits as soon as the charger is
+unplugged or the prompt times out.
+
+    python unplug_prompt.py [--timeout 30]
+"""
+import argparse
+import time
+import tkinter as tk
+
+import psutil
+
+POLL_MS = 1000
+STUCK_GRACE = 30
+WIDTH, HEIGHT = 480, 240
+
+
+class UnplugPrompt:
+    def __init__(self, root, timeout: int):
+        self.root = root
+        self.timeout = timeout
+        self.started_at = time.monotonic()
+        root.title("Battery Full - Action Required")
+        root.resizable(False, False)
+        root.attributes('-topmost', True)
+        x = (root.winfo_screenwidth() - WIDTH) // 2
+        y = (root.winfo_screenheight() - HEIGHT) // 2
+        root.geometry(f"{WIDTH}x{HEIGHT}+{x}+{y}")
+
+        tk.Label(root, text="Battery Full!\nPlease Unplug Charger", font=("Segoe UI", 20, "bold"),
+                 fg="#FF4500").pack(pady=(24, 8))
+        tk.Label(root, text="Unplugging at full charge extends battery lifespan\nand reduces energy waste.",
+                 font=("Segoe UI", 11)).pack(pady=(0, 12))
+        self.countdown = tk.Label(root, text=f"Auto-close in {timeout}s", font=("Segoe UI", 12, "bold"))
+        self.countdown.pack()
+        self.close_button = tk.Button(root, text="Close", width=10, command=root.destroy)
+        root.bind("<Escape>", lambda event: self.close_button.winfo_ismapped() and root.destroy())
+        self.poll()
+
+    def poll(self):
+        battery = psutil.sensors_battery()
+        if battery and not battery.power_plugged:
+            self.root.destroy()
+            return
+        elapsed = time.monotonic() - self.started_at
+        if elapsed >= self.timeout + STUCK_GRACE:
+            self.root.destroy()
+            return
+        if elapsed >= self.timeout:
+            self.countdown.configure(text="Auto-close in 0s")
+            if not self.close_button.winfo_ismapped():
+                self.close_button.pack(pady=12)
+        else:
+            self.countdown.configure(text=f"Auto-close in {self.timeout - int(elapsed)}s")
+        self.root.after(POLL_MS, self.poll)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ask the user to unplug the charger")
+    parser.add_argument("--timeout", type=int, default=30)
+    args = parser.parse_args()
+    root = tk.Tk()
+    UnplugPrompt(root, args.timeout)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ from typing import Dict, Optional
 import winreg
 
 import psutil
+
+from charge_estimator import shared_estimator
 try:
     import win32api
     import win32con
@@ -95,9 +97,7 @@ def calculate_battery_time(battery: Optional[psutil.sensors_battery]) -> str:
     if battery.power_plugged:
         current_percent = battery.percent
         remaining_percent = 100 - current_percent
-        charging_rate = 40.0 + (60.0 - 40.0) * (1 - current_percent / 100)
-        hours_to_full = remaining_percent / charging_rate
-        total_seconds = int(hours_to_full * 3600)
+        total_seconds = int(shared_estimator().seconds_to_full(current_percent))
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
         return f"Time to Full Charge: {hours}h {minutes}m" if remaining_percent > 0 else "Time to Full Charge: Fully Charged"